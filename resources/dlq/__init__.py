@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from .config import DLQConfig
-from .domain import DeadLetterEntry, FailureCategory
+from .domain import DeadLetterEntry, DLQIngressItem, FailureCategory
 from .service import DeadLetterQueue
 
 __all__ = [
     "DLQConfig",
+    "DLQIngressItem",
     "DeadLetterEntry",
     "DeadLetterQueue",
     "FailureCategory",
@@ -52,6 +52,11 @@ class DLQConfig(BaseModel):
         ge=1000,
         description="Idle time before entry can be claimed from dead consumer",
     )
+    count_cache_ttl_ms: int = Field(
+        default=100,
+        ge=0,
+        description="How long get_message_count/get_pending_count results are reused (0 = no caching)",
+    )
     batch_size: int = Field(
         default=100,
         ge=1,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 
 class FailureCategory(str, Enum):
@@ -16,14 +18,17 @@ class FailureCategory(str, Enum):
     DEPENDENCY_FAILURE = "dependency"
 
 
-class DeadLetterEntry(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True, kw_only=True, config=ConfigDict(extra="forbid"))
+class DeadLetterEntry:
     """Represents an entry in the Dead Letter Queue.
 
     Contains the original message payload plus failure metadata
     for debugging and redrive operations.
-    """
 
-    model_config = ConfigDict(frozen=True, extra="forbid")
+    A slotted pydantic dataclass rather than a `BaseModel`: field validation
+    is kept, but instances carry no per-instance ``__dict__``, which adds up
+    when `peek`/`claim_stale` materialize thousands of entries.
+    """
 
     id: str = Field(
         min_length=1,
@@ -72,3 +77,21 @@ class DeadLetterEntry(BaseModel):
         default_factory=dict,
         description="Arbitrary headers/metadata from original message",
     )
+
+
+@dataclass(frozen=True, slots=True)
+class DLQIngressItem:
+    """A failed message to route to the DLQ via `DeadLetterQueue.dead_letter_many`.
+
+    Mirrors the arguments of `DeadLetterQueue.dead_letter`. A plain dataclass
+    rather than a model since it only carries arguments for a single call
+    and holds a live exception.
+    """
+
+    payload: bytes
+    error: Exception
+    source_queue: str
+    retry_count: int = 0
+    category: FailureCategory = FailureCategory.TRANSIENT
+    metadata: dict[str, str] | None = None
+    entry_id: str | None = None
@@ -1,25 +1,66 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import logging
+import time
 import traceback
 import uuid
 from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Awaitable, cast
+from typing import TYPE_CHECKING, Any, Awaitable, cast
 
+from pydantic_core import from_json, to_json
 from redis.exceptions import ResponseError
 from redis.typing import EncodableT, FieldT, StreamIdT
 
 from ...core.logger import get_logger
 from .config import DLQConfig
-from .domain import DeadLetterEntry, FailureCategory
+from .domain import DeadLetterEntry, DLQIngressItem, FailureCategory
 
 if TYPE_CHECKING:
     from structlog.stdlib import BoundLogger
 
-    from ...infrastructure.redis.base import BaseRedisClient
+    from ...infrastructure.redis.base import BaseRedisClient, RedisClientType, RedisCommands
 
 logger: BoundLogger = get_logger(__name__)
+# structlog runs its processor chain before the stdlib level filter, so hot
+# paths check the underlying stdlib logger first to skip building the event.
+_level_logger = logging.getLogger(__name__)
+
+# XAUTOCLAIM was added in Redis 6.2
+_XAUTOCLAIM_MIN_VERSION = (6, 2)
+
+
+def _passthrough(value: str) -> str:
+    return value
+
+
+def _parse_redis_version(version: str) -> tuple[int, ...]:
+    """Parse a ``redis_version`` string such as ``"7.2.4"`` into a comparable tuple."""
+    parts: list[int] = []
+    for part in version.split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def _min_redis_version(server_info: dict[str, Any]) -> tuple[int, ...]:
+    """Return the lowest ``redis_version`` in an ``INFO server`` reply.
+
+    A standalone server replies with one flat dict. ``RedisCluster`` sends
+    INFO to every node and returns ``{node_name: {...}}`` unmerged, so the
+    oldest node decides which commands are safe to use.
+    """
+    if "redis_version" in server_info:
+        return _parse_redis_version(str(server_info["redis_version"]))
+    versions = [
+        _parse_redis_version(str(node_info.get("redis_version", "")))
+        for node_info in server_info.values()
+        if isinstance(node_info, dict)
+    ]
+    return min(versions, default=())
 
 
 class DeadLetterQueue:
@@ -27,7 +68,7 @@ class DeadLetterQueue:
 
     Provides reliable at-least-once delivery with:
     - Consumer groups for message acknowledgment (XREADGROUP + XACK)
-    - Stale message claiming from dead consumers (XCLAIM)
+    - Stale message claiming from dead consumers (XAUTOCLAIM, XCLAIM on Redis < 6.2)
     - Bounded stream length (maxlen)
     - Requeue limits to prevent infinite loops
     - Redrive to main queue for recovery
@@ -56,7 +97,9 @@ class DeadLetterQueue:
     ```
     """
 
-    # H1/H4: Lua script for atomic redrive (read + add + delete in single operation)
+    # H1/H4: Lua script for atomic redrive (read + add + delete in single operation).
+    # The main-queue entry has the same shape `redrive_messages` writes:
+    # ``message_id``, ``payload`` and one field per metadata key.
     _REDRIVE_LUA_SCRIPT: str = """
 local dlq_stream = KEYS[1]
 local main_stream = KEYS[2]
@@ -68,11 +111,56 @@ if #entries == 0 then
     return nil
 end
 
--- Get the fields from the entry
+-- Pick out the fields the main queue needs
 local fields = entries[1][2]
+local entry_id, payload, meta_json = '', '', nil
+local legacy_meta = {}
+for i = 1, #fields, 2 do
+    local key, value = fields[i], fields[i + 1]
+    if key == 'id' then
+        entry_id = value
+    elseif key == 'payload' then
+        payload = value
+    elseif key == 'meta' then
+        meta_json = value
+    elseif string.sub(key, 1, 5) == 'meta_' then
+        legacy_meta[#legacy_meta + 1] = string.sub(key, 6)
+        legacy_meta[#legacy_meta + 1] = value
+    end
+end
 
--- Add to main queue with all original fields
-redis.call('XADD', main_stream, '*', unpack(fields))
+-- Metadata keys are flattened after the base fields and, like a dict
+-- update, a key that repeats an earlier one replaces its value
+local out = {'message_id', entry_id, 'payload', payload}
+local positions = {message_id = 2, payload = 4}
+local function put(key, value)
+    local pos = positions[key]
+    if pos then
+        out[pos] = value
+    else
+        out[#out + 1] = key
+        out[#out + 1] = value
+        positions[key] = #out
+    end
+end
+
+if meta_json then
+    -- Metadata that is not a JSON object is dropped, as _parse_entry does
+    local ok, meta = pcall(cjson.decode, meta_json)
+    if ok and type(meta) == 'table' and string.match(meta_json, '^%s*{') then
+        for key, value in pairs(meta) do
+            if type(value) == 'string' then
+                put(key, value)
+            end
+        end
+    end
+else
+    for i = 1, #legacy_meta, 2 do
+        put(legacy_meta[i], legacy_meta[i + 1])
+    end
+end
+
+redis.call('XADD', main_stream, '*', unpack(out))
 
 -- Delete from DLQ (atomic - either both happen or neither)
 redis.call('XDEL', dlq_stream, stream_id)
@@ -85,6 +173,16 @@ return 1
         self._config = config or DLQConfig()
         self._consumer_id = f"worker_{uuid.uuid4().hex[:8]}"
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._supports_xautoclaim = False
+        # The client returns either str or bytes for every reply depending on
+        # decode_responses, so pick the conversion once instead of per value.
+        self._to_str: Callable[[Any], str] = (
+            _passthrough if redis_client.config.driver.decode_responses else bytes.decode
+        )
+        # (monotonic timestamp, value) for the polled monitoring counters
+        self._len_cache: tuple[float, int] = (float("-inf"), 0)
+        self._pending_cache: tuple[float, int] = (float("-inf"), 0)
 
     @property
     def consumer_id(self) -> str:
@@ -111,39 +209,50 @@ return 1
         """Initialize consumer group for the DLQ stream.
 
         Creates the consumer group if it doesn't exist. Safe to call multiple times.
+
+        Concurrent callers are serialized by a per-instance lock so only one
+        of them issues XGROUP CREATE; the rest return once it completes.
         """
         if self._initialized:
             return
 
-        async with self._redis_client.aget_client() as client:
-            try:
-                await client.xgroup_create(
-                    name=self._config.stream_name,
-                    groupname=self._config.consumer_group,
-                    id="0",
-                    mkstream=True,
-                )
-                logger.info(
-                    "Created DLQ consumer group",
-                    stream=self._config.stream_name,
-                    group=self._config.consumer_group,
-                )
-            except ResponseError as e:
-                if "BUSYGROUP" in str(e):
-                    logger.debug(
-                        "Consumer group already exists",
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            async with self._redis_client.aget_client() as client:
+                try:
+                    await client.xgroup_create(
+                        name=self._config.stream_name,
+                        groupname=self._config.consumer_group,
+                        id="0",
+                        mkstream=True,
+                    )
+                    logger.info(
+                        "Created DLQ consumer group",
                         stream=self._config.stream_name,
                         group=self._config.consumer_group,
                     )
-                else:
-                    raise
-
-        self._initialized = True
-        logger.info(
-            "DLQ initialized",
-            stream=self._config.stream_name,
-            consumer_id=self._consumer_id,
-        )
+                except ResponseError as e:
+                    if "BUSYGROUP" in str(e):
+                        logger.debug(
+                            "Consumer group already exists",
+                            stream=self._config.stream_name,
+                            group=self._config.consumer_group,
+                        )
+                    else:
+                        raise
+
+                server_info = await client.info("server")
+                self._supports_xautoclaim = _min_redis_version(server_info) >= _XAUTOCLAIM_MIN_VERSION
+
+            self._initialized = True
+            logger.info(
+                "DLQ initialized",
+                stream=self._config.stream_name,
+                consumer_id=self._consumer_id,
+                xautoclaim=self._supports_xautoclaim,
+            )
 
     async def dead_letter(
         self,
@@ -181,23 +290,9 @@ return 1
             The Redis Stream entry ID.
         """
         effective_id = entry_id or str(uuid.uuid4())
-
-        fields: dict[FieldT, EncodableT] = {
-            "id": effective_id,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "source_queue": source_queue,
-            "payload": base64.b64encode(payload).decode(),
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "error_traceback": "".join(traceback.format_exception(type(error), error, error.__traceback__)),
-            "retry_count": str(retry_count),
-            "requeue_count": "0",
-            "category": category.value,
-        }
-
-        if metadata:
-            for key, value in metadata.items():
-                fields[f"meta_{key}"] = value
+        fields = self._build_dead_letter_fields(
+            effective_id, payload, error, source_queue, retry_count, category, metadata
+        )
 
         async with self._redis_client.aget_client() as client:
             stream_id_raw = await client.xadd(
@@ -205,19 +300,79 @@ return 1
                 fields=fields,
                 maxlen=self._config.max_stream_length,
             )
-            stream_id = stream_id_raw.decode() if isinstance(stream_id_raw, bytes) else str(stream_id_raw)
+            stream_id = self._to_str(stream_id_raw)
+        self._invalidate_counts()
 
-        logger.warning(
-            "Routed to DLQ",
-            stream_id=stream_id,
-            entry_id=effective_id,
-            error_type=type(error).__name__,
-            category=category.value,
-            source_queue=source_queue,
-        )
+        if _level_logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Routed to DLQ",
+                stream_id=stream_id,
+                entry_id=effective_id,
+                error_type=type(error).__name__,
+                category=category.value,
+                source_queue=source_queue,
+            )
 
         return stream_id
 
+    async def dead_letter_many(self, items: Sequence[DLQIngressItem]) -> list[str]:
+        """Route a batch of failed messages to the Dead Letter Queue.
+
+        All XADDs are sent in one non-transactional pipeline, so the batch
+        costs a single round trip instead of one per message.
+
+        Parameters
+        ----------
+        items : Sequence[DLQIngressItem]
+            Failed messages to route.
+
+        Returns
+        -------
+        list[str]
+            The Redis Stream entry IDs, in the same order as ``items``.
+        """
+        if not items:
+            return []
+
+        entry_ids = [item.entry_id or str(uuid.uuid4()) for item in items]
+        batch_fields = [
+            self._build_dead_letter_fields(
+                entry_id,
+                item.payload,
+                item.error,
+                item.source_queue,
+                item.retry_count,
+                item.category,
+                item.metadata,
+            )
+            for entry_id, item in zip(entry_ids, items, strict=True)
+        ]
+
+        async with (
+            self._redis_client.aget_client() as client,
+            cast("RedisClientType", client).pipeline(transaction=False) as pipe,
+        ):
+            for fields in batch_fields:
+                pipe.xadd(
+                    name=self._config.stream_name,
+                    fields=fields,
+                    maxlen=self._config.max_stream_length,
+                )
+            stream_ids_raw = await pipe.execute()
+        self._invalidate_counts()
+
+        stream_ids = [self._to_str(stream_id_raw) for stream_id_raw in stream_ids_raw]
+
+        if _level_logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Routed batch to DLQ",
+                count=len(stream_ids),
+                first_stream_id=stream_ids[0],
+                last_stream_id=stream_ids[-1],
+            )
+
+        return stream_ids
+
     async def read(self, *, max_count: int | None = None) -> list[DeadLetterEntry]:
         """Read entries from DLQ using consumer group (consuming read).
 
@@ -249,18 +404,20 @@ return 1
                 count=effective_count,
                 block=self._config.block_timeout_ms,
             )
+        if raw_entries:
+            self._invalidate_counts()
 
         entries: list[DeadLetterEntry] = []
 
         if raw_entries:
             for _stream_name, stream_entries in raw_entries:
                 for stream_id_raw, fields_raw in stream_entries:
-                    stream_id = stream_id_raw.decode() if isinstance(stream_id_raw, bytes) else str(stream_id_raw)
+                    stream_id = self._to_str(stream_id_raw)
                     fields = self._decode_fields(fields_raw)
                     entry = self._parse_entry(stream_id, fields)
                     entries.append(entry)
 
-        if entries:
+        if entries and _level_logger.isEnabledFor(logging.INFO):
             logger.info(
                 "Read entries from DLQ",
                 count=len(entries),
@@ -298,7 +455,7 @@ return 1
 
         entries: list[DeadLetterEntry] = []
         for stream_id_raw, fields_raw in raw_entries:
-            stream_id = stream_id_raw.decode() if isinstance(stream_id_raw, bytes) else str(stream_id_raw)
+            stream_id = self._to_str(stream_id_raw)
             fields = self._decode_fields(fields_raw)
             entry = self._parse_entry(stream_id, fields)
             entries.append(entry)
@@ -337,12 +494,14 @@ return 1
                 self._config.consumer_group,
                 *stream_ids,
             )
+        self._invalidate_counts()
 
-        logger.info(
-            "Acknowledged DLQ entries",
-            count=acked,
-            stream_ids=stream_ids,
-        )
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Acknowledged DLQ entries",
+                count=acked,
+                stream_ids=stream_ids,
+            )
 
         return int(acked)
 
@@ -393,8 +552,8 @@ return 1
             "category": entry.category.value,
         }
 
-        for key, value in entry.metadata.items():
-            fields[f"meta_{key}"] = value
+        if entry.metadata:
+            fields["meta"] = to_json(entry.metadata)
 
         # H2: Perform XADD and XACK in same context manager to reduce race window
         async with self._redis_client.aget_client() as client:
@@ -403,7 +562,7 @@ return 1
                 fields=fields,
                 maxlen=self._config.max_stream_length,
             )
-            stream_id = stream_id_raw.decode() if isinstance(stream_id_raw, bytes) else str(stream_id_raw)
+            stream_id = self._to_str(stream_id_raw)
 
             # Acknowledge old entry in same connection to minimize race window
             if entry.stream_id:
@@ -412,14 +571,16 @@ return 1
                     self._config.consumer_group,
                     entry.stream_id,
                 )
+        self._invalidate_counts()
 
-        logger.warning(
-            "Requeued DLQ entry",
-            entry_id=entry.id,
-            old_stream_id=entry.stream_id,
-            new_stream_id=stream_id,
-            requeue_count=new_requeue_count,
-        )
+        if _level_logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Requeued DLQ entry",
+                entry_id=entry.id,
+                old_stream_id=entry.stream_id,
+                new_stream_id=stream_id,
+                requeue_count=new_requeue_count,
+            )
 
         return stream_id
 
@@ -441,37 +602,28 @@ return 1
         """
         self._ensure_initialized()
         async with self._redis_client.aget_client() as client:
-            pending_raw = await client.xpending_range(
-                name=self._config.stream_name,
-                groupname=self._config.consumer_group,
-                min="-",
-                max="+",
-                count=self._config.batch_size,
-            )
-
-            stale_ids: list[StreamIdT] = []
-            for pending_entry in pending_raw:
-                message_id = pending_entry.get("message_id")
-                time_since_delivered = pending_entry.get("time_since_delivered", 0)
-
-                if message_id and time_since_delivered > self._config.claim_timeout_ms:
-                    msg_id_str: StreamIdT = message_id.decode() if isinstance(message_id, bytes) else str(message_id)
-                    stale_ids.append(msg_id_str)
-
-            if not stale_ids:
-                return []
-
-            claimed_raw = await client.xclaim(
-                name=self._config.stream_name,
-                groupname=self._config.consumer_group,
-                consumername=self._consumer_id,
-                min_idle_time=self._config.claim_timeout_ms,
-                message_ids=stale_ids,
-            )
+            if self._supports_xautoclaim:
+                # XAUTOCLAIM filters by idle time and claims server-side in one round trip
+                autoclaim_raw = await client.xautoclaim(
+                    name=self._config.stream_name,
+                    groupname=self._config.consumer_group,
+                    consumername=self._consumer_id,
+                    min_idle_time=self._config.claim_timeout_ms,
+                    start_id="0-0",
+                    count=self._config.batch_size,
+                )
+                claimed_raw = autoclaim_raw[1]
+            else:
+                claimed_raw = await self._xclaim_stale(client)
+        self._invalidate_counts()
 
         entries: list[DeadLetterEntry] = []
         for stream_id_raw, fields_raw in claimed_raw:
-            stream_id = stream_id_raw.decode() if isinstance(stream_id_raw, bytes) else str(stream_id_raw)
+            # Entries deleted while pending come back with a nil body, which
+            # redis-py parses to ``{}`` on both the XAUTOCLAIM and XCLAIM paths
+            if not fields_raw:
+                continue
+            stream_id = self._to_str(stream_id_raw)
             fields = self._decode_fields(fields_raw)
             entry = self._parse_entry(stream_id, fields)
             entries.append(entry)
@@ -485,11 +637,44 @@ return 1
 
         return entries
 
+    async def _xclaim_stale(self, client: RedisCommands) -> list[tuple[bytes | str, dict[bytes | str, bytes | str]]]:
+        """Claim stale entries via XPENDING + XCLAIM for servers without XAUTOCLAIM."""
+        pending_raw = await client.xpending_range(
+            name=self._config.stream_name,
+            groupname=self._config.consumer_group,
+            min="-",
+            max="+",
+            count=self._config.batch_size,
+        )
+
+        stale_ids: list[StreamIdT] = []
+        for pending_entry in pending_raw:
+            message_id = pending_entry.get("message_id")
+            time_since_delivered = pending_entry.get("time_since_delivered", 0)
+
+            if message_id and time_since_delivered > self._config.claim_timeout_ms:
+                msg_id_str: StreamIdT = self._to_str(message_id)
+                stale_ids.append(msg_id_str)
+
+        if not stale_ids:
+            return []
+
+        return await client.xclaim(
+            name=self._config.stream_name,
+            groupname=self._config.consumer_group,
+            consumername=self._consumer_id,
+            min_idle_time=self._config.claim_timeout_ms,
+            message_ids=stale_ids,
+        )
+
     async def redrive_message(self, stream_id: str, target_queue: str) -> bool:
         """Redrive a single entry from DLQ to main queue.
 
         Uses a Lua script for atomic read+add+delete to prevent duplicates
-        or message loss on crash.
+        or message loss on crash. The main-queue entry carries
+        ``message_id``, the base64 ``payload`` and one field per metadata
+        key, exactly as `redrive_messages` writes it; the DLQ-only fields
+        (error details, counters, the JSON ``meta`` blob) are not copied.
 
         Parameters
         ----------
@@ -525,6 +710,7 @@ return 1
             )
 
         if result:
+            self._invalidate_counts()
             logger.info(
                 "Redrove entry from DLQ",
                 stream_id=stream_id,
@@ -547,6 +733,9 @@ return 1
     ) -> int:
         """Redrive entries from DLQ to main queue.
 
+        Each main-queue entry has the same shape `redrive_message` writes:
+        ``message_id``, the base64 ``payload`` and one field per metadata key.
+
         Parameters
         ----------
         target_queue : str
@@ -588,7 +777,7 @@ return 1
                 ids_to_delete: list[str] = []
 
                 for stream_id_raw, fields_raw in raw_entries:
-                    stream_id = stream_id_raw.decode() if isinstance(stream_id_raw, bytes) else str(stream_id_raw)
+                    stream_id = self._to_str(stream_id_raw)
 
                     if stream_id == last_id:
                         continue
@@ -616,6 +805,7 @@ return 1
 
                 if ids_to_delete:
                     await client.xdel(self._config.stream_name, *ids_to_delete)
+                    self._invalidate_counts()
 
                 if len(raw_entries) < fetch_count:
                     break
@@ -628,40 +818,104 @@ return 1
 
         return redriven_count
 
-    async def get_message_count(self) -> int:
-        """Get total number of entries in DLQ stream."""
+    async def get_message_count(self, *, force: bool = False) -> int:
+        """Get total number of entries in DLQ stream.
+
+        Results are reused for ``count_cache_ttl_ms`` so that metric scrapers
+        polling this method do not issue one XLEN per call. Any mutation made
+        through this instance drops the cached value.
+
+        Parameters
+        ----------
+        force : bool
+            Bypass the cache and always query Redis.
+        """
+        now = time.monotonic()
+        cached_at, cached_len = self._len_cache
+        if not force and now - cached_at < self._config.count_cache_ttl_ms / 1000:
+            return cached_len
+
         async with self._redis_client.aget_client() as client:
             result = await cast(Awaitable[int], client.xlen(self._config.stream_name))
-            return result
 
-    async def get_pending_count(self) -> int:
-        """Get number of entries pending acknowledgment."""
+        self._len_cache = (now, result)
+        return result
+
+    async def get_pending_count(self, *, force: bool = False) -> int:
+        """Get number of entries pending acknowledgment.
+
+        Cached the same way as `get_message_count`.
+
+        Parameters
+        ----------
+        force : bool
+            Bypass the cache and always query Redis.
+        """
+        now = time.monotonic()
+        cached_at, cached_pending = self._pending_cache
+        if not force and now - cached_at < self._config.count_cache_ttl_ms / 1000:
+            return cached_pending
+
         async with self._redis_client.aget_client() as client:
             pending_info = await client.xpending(
                 name=self._config.stream_name,
                 groupname=self._config.consumer_group,
             )
-            return pending_info.get("pending", 0) if pending_info else 0
+
+        pending = pending_info.get("pending", 0) if pending_info else 0
+        self._pending_cache = (now, pending)
+        return pending
+
+    def _invalidate_counts(self) -> None:
+        """Drop cached counts so the next read after a mutation hits Redis."""
+        self._len_cache = (float("-inf"), 0)
+        self._pending_cache = (float("-inf"), 0)
+
+    @staticmethod
+    def _build_dead_letter_fields(
+        entry_id: str,
+        payload: bytes,
+        error: Exception,
+        source_queue: str,
+        retry_count: int,
+        category: FailureCategory,
+        metadata: dict[str, str] | None,
+    ) -> dict[FieldT, EncodableT]:
+        """Build the stream fields for a newly dead-lettered message."""
+        fields: dict[FieldT, EncodableT] = {
+            "id": entry_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "source_queue": source_queue,
+            "payload": base64.b64encode(payload).decode(),
+            "error_type": type(error).__name__,
+            "error_message": str(error),
+            "error_traceback": "".join(traceback.format_exception(type(error), error, error.__traceback__)),
+            "retry_count": str(retry_count),
+            "requeue_count": "0",
+            "category": category.value,
+        }
+
+        if metadata:
+            fields["meta"] = to_json(metadata)
+
+        return fields
 
     def _decode_fields(self, fields_raw: dict[bytes | str, bytes | str]) -> dict[str, str]:
         """Decode Redis bytes to strings."""
-        result: dict[str, str] = {}
-        for key, value in fields_raw.items():
-            key_str = key.decode() if isinstance(key, bytes) else str(key)
-            value_str = value.decode() if isinstance(value, bytes) else str(value)
-            result[key_str] = value_str
-        return result
+        to_str = self._to_str
+        return {to_str(key): to_str(value) for key, value in fields_raw.items()}
+
+    @staticmethod
+    def _safe_int(value: str | bytes, default: int = 0) -> int:
+        """Parse integer with fallback for corrupted data.
 
-    def _safe_int(self, value: str, default: int = 0) -> int:
-        """Parse integer with fallback for corrupted data."""
+        Accepts raw bytes as well as str; ``int()`` parses ASCII digits from
+        bytes directly, so callers need not decode first. Logging is left to
+        the caller so the happy path stays a bare ``int()`` call.
+        """
         try:
             return int(value)
         except (ValueError, TypeError):
-            logger.warning(
-                "Invalid integer value, using default",
-                value=value,
-                default=default,
-            )
             return default
 
     def _parse_entry(self, stream_id: str, fields: dict[str, str]) -> DeadLetterEntry:
@@ -672,13 +926,27 @@ return 1
         ValueError
             If payload is corrupted (base64 decode fails).
         """
-        metadata: dict[str, str] = {}
-        for key, value in fields.items():
-            if key.startswith("meta_"):
-                metadata[key[5:]] = value
-
         entry_id = fields.get("id", "")
 
+        metadata_json = fields.get("meta")
+        if metadata_json is not None:
+            try:
+                decoded = from_json(metadata_json)
+            except ValueError:
+                decoded = None
+            if isinstance(decoded, dict):
+                metadata = cast("dict[str, str]", decoded)
+            else:
+                logger.warning(
+                    "Invalid metadata JSON, using empty metadata",
+                    raw_metadata=metadata_json,
+                    entry_id=entry_id,
+                )
+                metadata = {}
+        else:
+            # Legacy entries stored one `meta_<key>` field per metadata key
+            metadata = {key[5:]: value for key, value in fields.items() if key.startswith("meta_")}
+
         # C4: Log timestamp fallback
         timestamp_str = fields.get("timestamp", "")
         try:
@@ -697,6 +965,20 @@ return 1
         except ValueError:
             category = FailureCategory.TRANSIENT
 
+        raw_retry_count = fields.get("retry_count", "0")
+        raw_requeue_count = fields.get("requeue_count", "0")
+        retry_count = self._safe_int(raw_retry_count, -1)
+        requeue_count = self._safe_int(raw_requeue_count, -1)
+        if retry_count < 0 or requeue_count < 0:
+            logger.warning(
+                "Invalid counter values, using default",
+                raw_retry_count=raw_retry_count,
+                raw_requeue_count=raw_requeue_count,
+                entry_id=entry_id,
+            )
+            retry_count = max(retry_count, 0)
+            requeue_count = max(requeue_count, 0)
+
         # C3: Fail loudly on base64 decode failure (industry standard: data integrity)
         payload_b64 = fields.get("payload", "")
         try:
@@ -717,8 +999,8 @@ return 1
             error_type=fields.get("error_type", ""),
             error_message=fields.get("error_message", ""),
             error_traceback=fields.get("error_traceback", ""),
-            retry_count=self._safe_int(fields.get("retry_count", "0")),
-            requeue_count=self._safe_int(fields.get("requeue_count", "0")),
+            retry_count=retry_count,
+            requeue_count=requeue_count,
             category=category,
             source_queue=fields.get("source_queue", ""),
             timestamp=timestamp,
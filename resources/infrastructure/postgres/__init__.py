@@ -35,7 +35,7 @@ from .config import (
 )
 from .exceptions import AsyncpgWrapperError, PoolNotInitializedError
 from .health import ClusterHealthResult, HealthCheckResult, PoolHealthBase, ReplicaHealthInfo
-from .pool import AsyncConnectionPool, IsolationLevel
+from .pool import AsyncConnectionPool, IsolationLevel, PoolStats
 
 __all__ = [
     "AsyncConnectionPool",
@@ -52,5 +52,6 @@ __all__ = [
     "IsolationLevel",
     "PoolHealthBase",
     "PoolNotInitializedError",
+    "PoolStats",
     "ReplicaHealthInfo",
 ]
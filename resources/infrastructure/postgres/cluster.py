@@ -90,7 +90,9 @@ See Also:
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Self
+import contextlib
+import itertools
+from typing import TYPE_CHECKING, Any, Self
 
 from hypervigilant.structlog import get_logger
 
@@ -101,6 +103,9 @@ from .pool import AsyncConnectionPool
 
 if TYPE_CHECKING:
     import types
+    from collections.abc import Coroutine, Iterable, Iterator
+
+    from .health import HealthCheckResult
 
 logger = get_logger(__name__)
 
@@ -127,12 +132,22 @@ class DatabaseCluster:
     ...     await cluster.replica.afetch("SELECT ...")    # Read (stale OK)
     """
 
-    __slots__ = ("_primary", "_replica_index", "_replicas")
+    __slots__ = (
+        "_health_check_interval_s",
+        "_health_task",
+        "_healthy_replicas",
+        "_primary",
+        "_replica_cycle",
+        "_replicas",
+        "_replicas_set",
+    )
 
     def __init__(
         self,
         primary: AsyncConnectionPool,
         replicas: list[AsyncConnectionPool] | None = None,
+        *,
+        health_check_interval_s: float | None = None,
     ) -> None:
         """Initialize cluster with primary and optional replicas.
 
@@ -143,6 +158,10 @@ class DatabaseCluster:
         replicas
             Optional list of replica (read-only) connection pools.
             If empty/None, ``.replica`` returns primary as fallback.
+        health_check_interval_s
+            If set, `ainitialize` starts a background task that runs
+            `ahealth_check` at this interval so ``.replica`` stops routing
+            to replicas that have gone down. None disables the task.
 
         Note
         ----
@@ -151,7 +170,11 @@ class DatabaseCluster:
         """
         self._primary = primary
         self._replicas = replicas or []
-        self._replica_index = 0
+        self._replicas_set = frozenset(self._replicas)
+        self._health_check_interval_s = health_check_interval_s
+        self._health_task: asyncio.Task[None] | None = None
+        self._healthy_replicas = self._replicas
+        self._replica_cycle: Iterator[AsyncConnectionPool] = itertools.cycle(self._replicas)
 
     async def __aenter__(self) -> Self:
         """Initialize all pools in the cluster."""
@@ -169,7 +192,7 @@ class DatabaseCluster:
             logger.error(
                 "DatabaseCluster exiting with exception",
                 exc_type=exc_type.__name__,
-                exc_val=str(exc_val),
+                exc_info=(exc_type, exc_val, exc_tb),
             )
         await self.aclose()
 
@@ -209,7 +232,7 @@ class DatabaseCluster:
         """
         primary = AsyncConnectionPool(config.primary)
         replicas = [AsyncConnectionPool(cfg) for cfg in config.replicas]
-        return cls(primary, replicas)
+        return cls(primary, replicas, health_check_interval_s=config.health_check_interval_s)
 
     async def ainitialize(self) -> None:
         """Initialize all pools in the cluster.
@@ -220,43 +243,45 @@ class DatabaseCluster:
             If primary pool fails to initialize. Replica failures are
             logged but do not prevent cluster initialization.
         """
+        replicas = self._replicas
         await self._primary.ainitialize()
         logger.info("Primary pool initialized")
 
-        results = await asyncio.gather(*(replica.ainitialize() for replica in self._replicas), return_exceptions=True)
-        initialized_replicas: list[AsyncConnectionPool] = []
-        for i, (replica, result) in enumerate(zip(self._replicas, results, strict=True)):
-            if isinstance(result, BaseException):
-                logger.warning(
-                    "Replica pool failed to initialize",
-                    replica_index=i,
-                    error=str(result),
-                )
-            else:
-                initialized_replicas.append(replica)
-                logger.info("Replica pool initialized", replica_index=i)
+        _, failed = await self._afan_out(replica.ainitialize() for replica in replicas)
+        initialized_replicas = [replica for i, replica in enumerate(replicas) if i not in failed]
+        if failed:
+            logger.warning("Replica pools failed to initialize", failed=self._format_failures(failed))
 
         self._replicas = initialized_replicas
+        self._replicas_set = frozenset(initialized_replicas)
+        self._set_healthy_replicas(initialized_replicas)
+
+        if self._health_check_interval_s is not None and self._health_task is None:
+            self._health_task = asyncio.create_task(self._arefresh_health(self._health_check_interval_s))
 
-        logger.info("Database cluster initialized", replica_count=len(self._replicas))
+        logger.info(
+            "Database cluster initialized",
+            replica_count=len(initialized_replicas),
+            failed_replica_count=len(failed),
+        )
 
     async def aclose(self) -> None:
         """Close all pools in the cluster."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+
         await self._primary.aclose()
         logger.info("Primary pool closed")
 
-        results = await asyncio.gather(*(replica.aclose() for replica in self._replicas), return_exceptions=True)
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
-                logger.warning(
-                    "Replica pool failed to close",
-                    replica_index=i,
-                    error=str(result),
-                )
-            else:
-                logger.info("Replica pool closed", replica_index=i)
+        replicas = self._replicas
+        _, failed = await self._afan_out(replica.aclose() for replica in replicas)
+        if failed:
+            logger.warning("Replica pools failed to close", failed=self._format_failures(failed))
 
-        logger.info("Database cluster closed")
+        logger.info("Database cluster closed", replica_count=len(replicas), failed_replica_count=len(failed))
 
     async def ahealth_check(self) -> ClusterHealthResult:
         """Check health of all pools in the cluster.
@@ -266,79 +291,140 @@ class DatabaseCluster:
         ClusterHealthResult
             Aggregated health status of primary and all replicas.
         """
+        replicas = self._replicas
+        n = len(replicas)
         primary_health = await self._primary.ahealth_check()
 
-        health_results = await asyncio.gather(
-            *(replica.ahealth_check() for replica in self._replicas),
-            return_exceptions=True,
+        health_results, failed = await self._afan_out(replica.ahealth_check() for replica in replicas)
+
+        replica_infos = tuple(
+            self._to_replica_info(i, result, failed.get(i)) for i, result in enumerate(health_results)
         )
+        healthy_count = sum(info.is_healthy() for info in replica_infos)
 
-        replica_infos: list[ReplicaHealthInfo] = []
-        healthy_count = 0
-
-        for i, result in enumerate(health_results):
-            if isinstance(result, BaseException):
-                replica_infos.append(
-                    ReplicaHealthInfo(
-                        host=f"replica-{i}",
-                        port=5432,
-                        status=HealthStatus.UNHEALTHY,
-                        pool_size=0,
-                        pool_max_size=0,
-                        pool_idle_size=0,
-                        latency_s=None,
-                        message=str(result),
-                    )
-                )
-            else:
-                replica_health = result
-                is_healthy = replica_health.status == HealthStatus.HEALTHY
-                if is_healthy:
-                    healthy_count += 1
-
-                replica_infos.append(
-                    ReplicaHealthInfo(
-                        host=f"replica-{i}",
-                        port=5432,
-                        status=replica_health.status,
-                        pool_size=replica_health.pool_size,
-                        pool_max_size=replica_health.pool_max_size,
-                        pool_idle_size=replica_health.pool_idle_size,
-                        latency_s=replica_health.latency_s,
-                        message=replica_health.message,
-                    )
-                )
+        self._set_healthy_replicas(
+            [replica for replica, info in zip(replicas, replica_infos, strict=True) if info.is_healthy()]
+        )
 
         if primary_health.status != HealthStatus.HEALTHY:
             overall_status = HealthStatus.UNHEALTHY
-        elif healthy_count < len(self._replicas):
+        elif healthy_count < n:
             overall_status = HealthStatus.DEGRADED
         else:
             overall_status = HealthStatus.HEALTHY
 
-        return ClusterHealthResult(
+        return ClusterHealthResult.model_construct(
             status=overall_status,
             primary=primary_health,
-            replicas=tuple(replica_infos),
+            replicas=replica_infos,
             healthy_replica_count=healthy_count,
-            total_replica_count=len(self._replicas),
+            total_replica_count=n,
+        )
+
+    @staticmethod
+    async def _afan_out[T](coros: Iterable[Coroutine[Any, Any, T]]) -> tuple[list[T | None], dict[int, Exception]]:
+        """Run one coroutine per replica concurrently and collect every outcome.
+
+        Each coroutine's exception is captured rather than raised, so one
+        failing replica neither cancels the others nor fails the whole
+        operation. Failures are recorded as they happen, so callers never
+        have to type-check results to tell them apart.
+
+        Returns
+        -------
+        tuple[list[T | None], dict[int, Exception]]
+            Results in input order (None where the coroutine failed), and
+            the exception raised by each failed coroutine keyed by index.
+        """
+        failures: dict[int, Exception] = {}
+
+        async def acapture(index: int, coro: Coroutine[Any, Any, T]) -> T | None:
+            try:
+                return await coro
+            except Exception as e:
+                failures[index] = e
+                return None
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(acapture(i, coro)) for i, coro in enumerate(coros)]
+        return [task.result() for task in tasks], failures
+
+    @staticmethod
+    def _format_failures(failures: dict[int, Exception]) -> dict[int, str]:
+        """Map replica index to error message for one aggregated log record."""
+        return {i: str(e) for i, e in failures.items()}
+
+    @staticmethod
+    def _to_replica_info(
+        index: int,
+        result: HealthCheckResult | None,
+        error: Exception | None,
+    ) -> ReplicaHealthInfo:
+        """Convert one replica's health check outcome into a `ReplicaHealthInfo`.
+
+        Every field comes from a `HealthCheckResult` the pool already built,
+        so validation is skipped with ``model_construct``.
+        """
+        if result is None:
+            return ReplicaHealthInfo.model_construct(
+                host=f"replica-{index}",
+                port=5432,
+                status=HealthStatus.UNHEALTHY,
+                pool_size=0,
+                pool_max_size=0,
+                pool_idle_size=0,
+                latency_s=None,
+                message=str(error),
+            )
+        return ReplicaHealthInfo.model_construct(
+            host=f"replica-{index}",
+            port=5432,
+            status=result.status,
+            pool_size=result.pool_size,
+            pool_max_size=result.pool_max_size,
+            pool_idle_size=result.pool_idle_size,
+            latency_s=result.latency_s,
+            message=result.message,
         )
 
+    def _set_healthy_replicas(self, healthy: list[AsyncConnectionPool]) -> None:
+        """Replace the set of replicas that ``.replica`` routes to.
+
+        A refresh that finds the same replicas healthy keeps the current
+        cycle, so periodic health checks neither allocate nor reset the
+        round-robin position back to the first replica.
+        """
+        if healthy == self._healthy_replicas:
+            return
+        self._healthy_replicas = healthy
+        self._replica_cycle = itertools.cycle(healthy)
+
+    async def _arefresh_health(self, interval_s: float) -> None:
+        """Re-run `ahealth_check` forever so routing tracks replica health."""
+        while True:
+            await asyncio.sleep(interval_s)
+            try:
+                await self.ahealth_check()
+            except Exception as e:
+                logger.warning("Background cluster health check failed", error=str(e))
+
     async def awarmup(self) -> None:
         """Warm up primary and all replica pools.
 
+        Replicas are warmed concurrently, so startup takes as long as the
+        slowest replica rather than the sum of all of them.
+
         Raises
         ------
         Exception
             If primary warmup fails. Replica failures are logged as warnings.
         """
+        replicas = self._replicas
         await self._primary.awarmup()
 
-        for i, replica in enumerate(self._replicas):
-            try:
-                await replica.awarmup()
-            except Exception as e:
-                logger.warning("Replica warmup failed", replica_index=i, error=str(e))
+        _, failed = await self._afan_out(replica.awarmup() for replica in replicas)
+        if failed:
+            logger.warning("Replica warmup failed", failed=self._format_failures(failed))
 
     @property
     def primary(self) -> AsyncConnectionPool:
@@ -362,8 +448,10 @@ class DatabaseCluster:
     def replica(self) -> AsyncConnectionPool:
         """Access a replica pool for read-only queries.
 
-        Uses round-robin selection across healthy replicas.
-        Returns primary as fallback if no replicas are configured.
+        Uses round-robin selection across healthy replicas. Replicas that
+        failed the most recent `ahealth_check` are skipped until a later
+        check sees them healthy again. Returns primary as fallback if no
+        healthy replicas are available.
 
         Use this for:
 
@@ -388,12 +476,13 @@ class DatabaseCluster:
         Replication lag means recently written data may not be visible.
         When in doubt, use ``.primary``.
         """
-        if not self._replicas:
+        if not self._healthy_replicas:
             return self._primary
 
-        pool = self._replicas[self._replica_index % len(self._replicas)]
-        self._replica_index += 1
-        return pool
+        # NOTE: `itertools.cycle` advances in C, so there is no modulo and no
+        # ever-growing index to store back on each access. The event loop is
+        # single-threaded, so `next()` needs no lock.
+        return next(self._replica_cycle)
 
     @property
     def replica_count(self) -> int:
@@ -403,4 +492,23 @@ class DatabaseCluster:
     @property
     def has_replicas(self) -> bool:
         """Check if cluster has replica pools configured."""
-        return len(self._replicas) > 0
+        return bool(self._replicas_set)
+
+    def is_replica(self, pool: AsyncConnectionPool) -> bool:
+        """Check whether ``pool`` is one of this cluster's replica pools.
+
+        Backed by a frozenset kept alongside the ordered replica list, so
+        tracing or audit code can tag which pool served a query in O(1).
+
+        Parameters
+        ----------
+        pool
+            The pool to look up, e.g. the one returned by ``.replica``.
+
+        Returns
+        -------
+        bool
+            True if ``pool`` is a replica of this cluster. The primary, and
+            therefore the ``.replica`` fallback, is not.
+        """
+        return pool in self._replicas_set
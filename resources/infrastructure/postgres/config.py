@@ -8,10 +8,11 @@ This module provides Pydantic models for configuring PostgreSQL connections.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Literal, Self
 from urllib.parse import quote_plus
 
-from pydantic import BaseModel, ConfigDict, Field, SecretStr, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, SecretStr, computed_field
 
 
 class AsyncpgConnectionSettings(BaseModel):
@@ -35,10 +36,20 @@ class AsyncpgPoolSettings(BaseModel):
     max_size: int = Field(default=20, ge=1, le=200)
     max_inactive_connection_lifetime: float = Field(default=300.0, ge=0.0)
     command_timeout: float = Field(default=60.0, ge=1.0, le=300.0)
+    # Not an asyncpg.create_pool() argument; bounds `ahealth_check` so a dead
+    # server is reported UNHEALTHY quickly instead of waiting on command_timeout.
+    health_check_timeout_s: float = Field(default=2.0, gt=0.0)
 
 
 class AsyncpgStatementCacheSettings(BaseModel):
-    """Statement cache settings for prepared statements."""
+    """Statement cache settings for prepared statements.
+
+    asyncpg keeps an LRU of prepared statements on every connection, keyed
+    by query text. Pool connections are long-lived and shared across
+    acquires, so repeated ``afetch``/``aexecute`` calls already skip
+    parse/plan once each connection has seen the query. Tune hit rate with
+    ``max_size`` here rather than layering another cache on the pool.
+    """
 
     model_config = ConfigDict(extra="forbid")
 
@@ -81,32 +92,53 @@ class AsyncpgConfig(BaseModel):
     statement_cache: AsyncpgStatementCacheSettings = Field(default_factory=AsyncpgStatementCacheSettings)
     server_settings: AsyncpgServerSettings = Field(default_factory=AsyncpgServerSettings)
 
+    _dsn: str = PrivateAttr()
+    _pool_params: dict[str, Any] = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Escape the credentials and build the DSN and pool params once; the config is frozen."""
+        connection = self.connection
+        password = connection.password.get_secret_value() if connection.password else ""
+        escaped_user = quote_plus(connection.user)
+        escaped_password = quote_plus(password) if password else ""
+        auth = f"{escaped_user}:{escaped_password}@" if escaped_password else f"{escaped_user}@"
+        self._dsn = f"postgresql://{auth}{connection.host}:{connection.port}/{connection.database}"
+
+        statement_cache = self.statement_cache
+        self._pool_params = {
+            "dsn": self._dsn,
+            **self.pool.model_dump(exclude={"health_check_timeout_s"}),
+            "statement_cache_size": statement_cache.max_size,
+            "max_cached_statement_lifetime": statement_cache.max_lifetime,
+            "max_cacheable_statement_size": statement_cache.max_cacheable_statement_size,
+            "server_settings": self.server_settings.model_dump(),
+        }
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the config, rebuilding the DSN and pool params since ``update`` may change them."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.model_post_init(None)
+        return copied
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def dsn(self) -> str:
-        """Build PostgreSQL DSN from connection settings."""
-        password = self.connection.password.get_secret_value() if self.connection.password else ""
-        escaped_user = quote_plus(self.connection.user)
-        escaped_password = quote_plus(password) if password else ""
-        auth = f"{escaped_user}:{escaped_password}@" if escaped_password else f"{escaped_user}@"
-        return f"postgresql://{auth}{self.connection.host}:{self.connection.port}/{self.connection.database}"
+        """PostgreSQL DSN built from connection settings."""
+        return self._dsn
 
     def to_pool_params(self) -> dict[str, Any]:
         """Convert config to asyncpg.create_pool() parameters.
 
+        The parameters are built once with the config; each call returns a
+        shallow copy. Nested values such as ``server_settings`` are shared
+        and must not be mutated.
+
         Returns
         -------
         dict[str, Any]
             Parameters for asyncpg.create_pool().
         """
-        return {
-            "dsn": self.dsn,
-            **self.pool.model_dump(),
-            "statement_cache_size": self.statement_cache.max_size,
-            "max_cached_statement_lifetime": self.statement_cache.max_lifetime,
-            "max_cacheable_statement_size": self.statement_cache.max_cacheable_statement_size,
-            "server_settings": self.server_settings.model_dump(),
-        }
+        return dict(self._pool_params)
 
     def for_replica(self, host: str, port: int | None = None) -> Self:
         """Create a replica config by copying this config with a different host.
@@ -174,6 +206,7 @@ class DatabaseClusterConfig(BaseModel):
 
     primary: AsyncpgConfig
     replicas: tuple[AsyncpgConfig, ...] = Field(default_factory=tuple)
+    health_check_interval_s: float | None = Field(default=None, gt=0)
 
     @classmethod
     def with_replica_hosts(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
 from typing import Self
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
@@ -15,7 +15,7 @@ class PoolHealthBase(BaseModel):
     monitoring across single pools and replicas.
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     status: HealthStatus
     pool_size: int
@@ -45,10 +45,21 @@ class ReplicaHealthInfo(PoolHealthBase):
 
 
 class HealthCheckResult(PoolHealthBase):
-    """Result of a database health check for a single pool."""
+    """Result of a database health check for a single pool.
 
-    timestamp: datetime = Field(default_factory=datetime.now)
-    replicas: tuple[ReplicaHealthInfo, ...] = Field(default_factory=tuple)
+    The ``initializing``/``unhealthy``/``healthy`` constructors fix the
+    shape themselves and skip validation via ``model_construct``; build
+    instances directly when the values come from outside the pool.
+    """
+
+    # Monotonic, so only meaningful within this process: use it to order
+    # results and to measure their age, not as a wall-clock time.
+    timestamp_ns: int = Field(default_factory=time.monotonic_ns)
+
+    @property
+    def timestamp_age_s(self) -> float:
+        """Seconds elapsed since this result was created."""
+        return (time.monotonic_ns() - self.timestamp_ns) / 1e9
 
     @classmethod
     def initializing(cls: type[Self], pool_max_size: int) -> Self:
@@ -64,7 +75,7 @@ class HealthCheckResult(PoolHealthBase):
         Self
             HealthCheckResult with INITIALIZING status.
         """
-        return cls(
+        return cls.model_construct(
             status=HealthStatus.INITIALIZING,
             pool_size=0,
             pool_max_size=pool_max_size,
@@ -88,7 +99,7 @@ class HealthCheckResult(PoolHealthBase):
         Self
             HealthCheckResult with UNHEALTHY status.
         """
-        return cls(
+        return cls.model_construct(
             status=HealthStatus.UNHEALTHY,
             pool_size=0,
             pool_max_size=pool_max_size,
@@ -103,7 +114,6 @@ class HealthCheckResult(PoolHealthBase):
         pool_max_size: int,
         latency_s: float,
         pool_idle_size: int,
-        replicas: tuple[ReplicaHealthInfo, ...] = (),
     ) -> Self:
         """Create result for successful health check.
 
@@ -117,32 +127,30 @@ class HealthCheckResult(PoolHealthBase):
             Health check latency in seconds.
         pool_idle_size
             Number of idle connections in the pool.
-        replicas
-            Health information for replicas (if any).
 
         Returns
         -------
         Self
             HealthCheckResult with HEALTHY status.
         """
-        return cls(
+        return cls.model_construct(
             status=HealthStatus.HEALTHY,
             pool_size=pool_size,
             pool_max_size=pool_max_size,
             latency_s=latency_s,
             message="Pool is healthy",
             pool_idle_size=pool_idle_size,
-            replicas=replicas,
         )
 
 
 class ClusterHealthResult(BaseModel):
     """Health check result for the entire database cluster.
 
-    Aggregates health status across primary and all replica pools.
+    Aggregates health status across primary and all replica pools. Replica
+    details live only here; ``primary`` is a plain single-pool result.
     """
 
-    model_config = ConfigDict(frozen=True)
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     status: HealthStatus
     primary: HealthCheckResult
@@ -7,8 +7,9 @@ topology with explicit routing, use `DatabaseCluster` instead.
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any, Literal, Self
+import itertools
+from contextlib import asynccontextmanager, suppress
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Self
 
 import asyncpg
 from asyncpg import Pool, Record
@@ -19,11 +20,12 @@ from .exceptions import PoolNotInitializedError
 from .health import HealthCheckResult
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterable, Sequence
+    from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable, Sequence
+    from contextlib import AbstractAsyncContextManager
     from types import TracebackType
 
-    from asyncpg.cursor import CursorIterator
-    from asyncpg.pool import PoolConnectionProxy
+    from asyncpg.pool import PoolAcquireContext, PoolConnectionProxy
+    from asyncpg.transaction import Transaction
 
     from .config import AsyncpgConfig
 
@@ -35,6 +37,67 @@ logger = get_logger(__name__)
 type IsolationLevel = Literal["read_uncommitted", "read_committed", "repeatable_read", "serializable"]
 
 
+class PoolStats(NamedTuple):
+    """Point-in-time pool sizes, as returned by `AsyncConnectionPool.pool_stats`."""
+
+    size: int
+    min_size: int
+    max_size: int
+    idle: int
+
+
+class _TransactionContext:
+    """Acquire a pooled connection and run one transaction on it.
+
+    Hand-written instead of stacking ``asynccontextmanager`` over the acquire
+    and transaction context managers, since it sits on the per-query path.
+    """
+
+    __slots__ = ("_acquire", "_deferrable", "_isolation", "_readonly", "_transaction")
+
+    def __init__(
+        self,
+        acquire: PoolAcquireContext[Record],
+        isolation: IsolationLevel,
+        *,
+        readonly: bool,
+        deferrable: bool,
+    ) -> None:
+        self._acquire = acquire
+        self._isolation: IsolationLevel = isolation
+        self._readonly = readonly
+        self._deferrable = deferrable
+        self._transaction: Transaction | None = None
+
+    async def __aenter__(self) -> PoolConnectionProxy[Record]:
+        conn = await self._acquire.__aenter__()
+        try:
+            self._transaction = conn.transaction(
+                isolation=self._isolation,
+                readonly=self._readonly,
+                deferrable=self._deferrable,
+            )
+            await self._transaction.__aenter__()
+        except BaseException as e:
+            await self._acquire.__aexit__(type(e), e, e.__traceback__)
+            raise
+        return conn
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        transaction = self._transaction
+        self._transaction = None
+        try:
+            if transaction is not None:
+                await transaction.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            await self._acquire.__aexit__(exc_type, exc_val, exc_tb)
+
+
 class AsyncConnectionPool:
     """Async connection pool for a single PostgreSQL database.
 
@@ -49,12 +112,19 @@ class AsyncConnectionPool:
     """
 
     # NOTE: Explain why we use __slots__
-    __slots__ = ("_config", "_init_lock", "_pool")
+    __slots__ = ("_config", "_health_cache", "_health_lock", "_init_lock", "_pool", "_pool_params")
+
+    # Health results younger than this are reused, so a burst of probes
+    # (orchestrator checks, dashboards, the cluster refresher) costs one SELECT 1.
+    _HEALTH_CHECK_TTL_S = 1.0
 
     def __init__(self, config: AsyncpgConfig) -> None:
         self._config = config
+        self._pool_params = config.to_pool_params()
         self._pool: Pool[Record] | None = None
         self._init_lock = asyncio.Lock()
+        self._health_lock = asyncio.Lock()
+        self._health_cache: tuple[float, HealthCheckResult] | None = None
 
     async def __aenter__(self) -> Self:
         await self.ainitialize()
@@ -70,7 +140,7 @@ class AsyncConnectionPool:
             logger.error(
                 "AsyncConnectionPool context manager exiting with exception",
                 exc_type=exc_type.__name__,
-                exc_val=str(exc_val),
+                exc_info=(exc_type, exc_val, exc_tb),
             )
         await self.aclose()
 
@@ -113,30 +183,44 @@ class AsyncConnectionPool:
         3. Task B checks self._pool is not None -> still False
         4. Both tasks create pools; one is orphaned (resource leak)
 
-        The lock serializes initialization, preventing this scenario.
+        The lock serializes initialization, preventing this scenario. Once
+        the pool exists, the unlocked check returns before touching the lock.
         """
+        if self._pool is not None:
+            return
+
         async with self._init_lock:
             if self._pool is not None:
                 return
 
-            self._pool = await asyncpg.create_pool(**self._config.to_pool_params())
+            self._pool = await asyncpg.create_pool(**self._pool_params)
 
             async with self._pool.acquire() as conn:
-                # NOTE: what is this line doing?
-                await conn.execute("SELECT 1")
+                # Fail fast if the server accepts connections but cannot run
+                # queries; fetchval is the same minimal round-trip used by
+                # the health check and warmup.
+                await conn.fetchval("SELECT 1")
 
-            logger.info("AsyncConnectionPool initialized", **self._config.to_pool_params())
+            logger.info("AsyncConnectionPool initialized", **self._pool_params)
 
     async def aclose(self) -> None:
         """Close the connection pool."""
         if self._pool is not None:
             await self._pool.close()
             self._pool = None
+            self._health_cache = None
             logger.info("AsyncConnectionPool closed")
 
     async def ahealth_check(self) -> HealthCheckResult:
         """Check pool health by executing a simple query.
 
+        The acquire and query are bounded by ``pool.health_check_timeout_s``;
+        a pool that does not answer in time is reported UNHEALTHY.
+
+        Results are cached for ``_HEALTH_CHECK_TTL_S`` seconds, and concurrent
+        callers that miss the cache wait on a single in-flight query instead
+        of each acquiring a connection.
+
         Returns
         -------
         HealthCheckResult
@@ -145,23 +229,65 @@ class AsyncConnectionPool:
         if self._pool is None:
             return HealthCheckResult.initializing(pool_max_size=self._config.pool.max_size)
 
+        loop = asyncio.get_running_loop()
+        cached = self._health_cache
+        if cached is not None and loop.time() - cached[0] < self._HEALTH_CHECK_TTL_S:
+            return cached[1]
+
+        async with self._health_lock:
+            # Another caller may have refreshed the result while we waited.
+            cached = self._health_cache
+            if cached is not None and loop.time() - cached[0] < self._HEALTH_CHECK_TTL_S:
+                return cached[1]
+
+            result = await self._aprobe_health()
+            self._health_cache = (loop.time(), result)
+            return result
+
+    async def _aprobe_health(self) -> HealthCheckResult:
+        """Run the health query against the pool, bypassing the cache."""
+        if self._pool is None:
+            return HealthCheckResult.initializing(pool_max_size=self._config.pool.max_size)
+
+        timeout_s = self._config.pool.health_check_timeout_s
         try:
-            async with Timer(silent=True) as t, self._pool.acquire() as conn:
+            async with asyncio.timeout(timeout_s), Timer(silent=True) as t, self._pool.acquire() as conn:
                 await conn.fetchval("SELECT 1")
             latency_s = t.elapsed_seconds
+        except TimeoutError:
+            return HealthCheckResult.unhealthy(
+                pool_max_size=self._config.pool.max_size,
+                error=f"Health check timed out after {timeout_s}s",
+            )
         except Exception as e:
             return HealthCheckResult.unhealthy(
                 pool_max_size=self._config.pool.max_size,
                 error=str(e),
             )
 
+        pool_size, pool_max_size, pool_idle_size = self._snapshot(self._pool)
         return HealthCheckResult.healthy(
-            pool_size=self._pool.get_size(),
-            pool_max_size=self._pool.get_max_size(),
+            pool_size=pool_size,
+            pool_max_size=pool_max_size,
             latency_s=latency_s,
-            pool_idle_size=self._pool.get_idle_size(),
+            pool_idle_size=pool_idle_size,
         )
 
+    @staticmethod
+    def _snapshot(pool: Pool[Record]) -> tuple[int, int, int]:
+        """Return ``(size, max_size, idle_size)`` from one pass over the pool.
+
+        ``get_size`` and ``get_idle_size`` each walk every connection holder;
+        this counts both in a single walk with the same per-holder checks.
+        """
+        size = idle = 0
+        for holder in pool._holders:  # noqa: SLF001
+            if holder.is_connected():
+                size += 1
+                if holder.is_idle():
+                    idle += 1
+        return size, pool.get_max_size(), idle
+
     async def awarmup(self) -> None:
         """Ensure all min_size connections are established and validated.
 
@@ -175,40 +301,109 @@ class AsyncConnectionPool:
         """
         if self._pool is None:
             await self.ainitialize()
+        pool = self.pool
 
+        # Connections are opened concurrently, so warmup costs roughly one
+        # handshake instead of min_size handshakes back to back.
         target = self._config.pool.min_size
+        acquired = await asyncio.gather(*(pool.acquire() for _ in range(target)), return_exceptions=True)
         connections: list[PoolConnectionProxy[Record]] = []
+        errors: list[BaseException] = []
+        for result in acquired:
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                connections.append(result)
         try:
-            for _ in range(target):
-                conn = await self._pool.acquire()  # type: ignore[union-attr]
-                await conn.fetchval("SELECT 1")
-                connections.append(conn)
+            if errors:
+                raise errors[0]
+            await asyncio.gather(*(conn.fetchval("SELECT 1") for conn in connections))
         finally:
-            for conn in connections:
-                await self._pool.release(conn)  # type: ignore[union-attr]
+            # Release whatever was acquired, even on partial failure, so nothing leaks.
+            await asyncio.gather(*(pool.release(conn) for conn in connections), return_exceptions=True)
 
         logger.info("Pool warmup completed", connections=target)
 
-    @asynccontextmanager
-    async def aacquire(self) -> AsyncIterator[PoolConnectionProxy[Record]]:
+    async def acheck(self) -> int:
+        """Validate the pool's idle connections on demand.
+
+        Checks out as many connections as are currently idle and probes each
+        with ``SELECT 1``. A connection that fails the probe is terminated, so
+        asyncpg opens a fresh one on its next acquire instead of handing a
+        broken connection to a caller. Connections already closed on the
+        client side are reconnected by asyncpg when checked out.
+
+        Acquires that fail or time out, e.g. because callers took the idle
+        connections first, are logged and skipped rather than raised.
+
+        Returns
+        -------
+        int
+            Number of connections that failed the probe and were discarded.
+        """
+        pool = self.pool
+        idle = pool.get_idle_size()
+        if idle == 0:
+            return 0
+
+        timeout_s = self._config.pool.health_check_timeout_s
+        acquired = await asyncio.gather(*(pool.acquire(timeout=timeout_s) for _ in range(idle)), return_exceptions=True)
+        connections: list[PoolConnectionProxy[Record]] = []
+        acquire_errors: list[BaseException] = []
+        for result in acquired:
+            if isinstance(result, BaseException):
+                acquire_errors.append(result)
+            else:
+                connections.append(result)
+        if acquire_errors:
+            # Busy or unreachable: these slots go unchecked until the next call.
+            logger.warning(
+                "Pool check could not acquire connections",
+                failed=len(acquire_errors),
+                requested=idle,
+                error=str(acquire_errors[0]),
+            )
+
+        async def aprobe(conn: PoolConnectionProxy[Record]) -> bool:
+            try:
+                await conn.fetchval("SELECT 1", timeout=timeout_s)
+            except (OSError, TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                conn.terminate()
+                return False
+            return True
+
+        try:
+            alive = await asyncio.gather(*(aprobe(conn) for conn in connections))
+        finally:
+            await asyncio.gather(*(pool.release(conn) for conn in connections), return_exceptions=True)
+
+        discarded = alive.count(False)
+        if discarded:
+            logger.warning("Discarded broken pool connections", discarded=discarded, checked=len(connections))
+        return discarded
+
+    def aacquire(self) -> PoolAcquireContext[Record]:
         """Acquire a connection from the pool.
 
-        Yields
-        ------
-        PoolConnectionProxy[Record]
-            A connection proxy that is returned to the pool on exit.
+        Returns asyncpg's own acquire context manager rather than wrapping
+        it: every query goes through here, and the generator-based
+        ``asynccontextmanager`` adds dispatch on each enter and exit.
+
+        Returns
+        -------
+        PoolAcquireContext[Record]
+            Async context manager yielding a connection proxy that is
+            returned to the pool on exit.
         """
-        async with self.pool.acquire() as conn:
-            yield conn
+        return self.pool.acquire()
 
-    @asynccontextmanager
-    async def atransaction(
+    def atransaction(
         self,
         isolation: IsolationLevel = "read_committed",
         *,
         readonly: bool = False,
         deferrable: bool = False,
-    ) -> AsyncIterator[PoolConnectionProxy[Record]]:
+    ) -> AbstractAsyncContextManager[PoolConnectionProxy[Record]]:
         """Acquire a connection and start a transaction.
 
         Parameters
@@ -220,20 +415,14 @@ class AsyncConnectionPool:
         deferrable
             If True and readonly=True, allows deferrable transactions.
 
-        Yields
-        ------
-        PoolConnectionProxy[Record]
-            A connection within a transaction context.
+        Returns
+        -------
+        AbstractAsyncContextManager[PoolConnectionProxy[Record]]
+            Async context manager yielding a connection within a transaction;
+            commits on clean exit, rolls back on error, then releases the
+            connection.
         """
-        async with (
-            self.aacquire() as conn,
-            conn.transaction(
-                isolation=isolation,
-                readonly=readonly,
-                deferrable=deferrable,
-            ),
-        ):
-            yield conn
+        return _TransactionContext(self.aacquire(), isolation, readonly=readonly, deferrable=deferrable)
 
     @asynccontextmanager
     async def acursor(
@@ -245,9 +434,13 @@ class AsyncConnectionPool:
         isolation: IsolationLevel = "read_committed",
         readonly: bool = False,
         deferrable: bool = False,
-    ) -> AsyncIterator[CursorIterator[Record]]:
+    ) -> AsyncIterator[AsyncIterator[Record]]:
         """Execute a query and return a cursor for iteration.
 
+        Rows are fetched in batches of ``prefetch`` by a background task that
+        stays up to two batches ahead of the consumer, so the round-trip for
+        the next batch overlaps with processing of the current one.
+
         Parameters
         ----------
         query
@@ -267,7 +460,7 @@ class AsyncConnectionPool:
 
         Yields
         ------
-        CursorIterator[Record]
+        AsyncIterator[Record]
             Async iterator over query results.
         """
         async with self.atransaction(
@@ -275,8 +468,35 @@ class AsyncConnectionPool:
             readonly=readonly,
             deferrable=deferrable,
         ) as conn:
-            cursor_factory = conn.cursor(query, *args, prefetch=prefetch, timeout=timeout)
-            yield cursor_factory.__aiter__()
+            cursor = await conn.cursor(query, *args, timeout=timeout)
+            # None marks exhaustion; an exception is re-raised to the consumer.
+            batches: asyncio.Queue[list[Record] | Exception | None] = asyncio.Queue(maxsize=2)
+
+            async def aproduce() -> None:
+                try:
+                    while batch := await cursor.fetch(prefetch, timeout=timeout):
+                        await batches.put(batch)
+                except Exception as e:
+                    await batches.put(e)
+                    return
+                await batches.put(None)
+
+            async def arows() -> AsyncGenerator[Record]:
+                while (batch := await batches.get()) is not None:
+                    if isinstance(batch, Exception):
+                        raise batch
+                    for row in batch:
+                        yield row
+
+            producer = asyncio.create_task(aproduce())
+            rows = arows()
+            try:
+                yield rows
+            finally:
+                await rows.aclose()
+                producer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await producer
 
     async def aexecute(self, query: str, *args: object, timeout: float | None = None) -> str:
         """Execute a query without returning results.
@@ -298,9 +518,24 @@ class AsyncConnectionPool:
         async with self.aacquire() as conn:
             return await conn.execute(query, *args, timeout=timeout)
 
-    async def aexecutemany(self, query: str, args: Iterable[Sequence[object]], timeout: float | None = None) -> None:
+    async def aexecutemany(
+        self,
+        query: str,
+        args: Iterable[Sequence[object]],
+        timeout: float | None = None,
+        *,
+        chunk_size: int | None = None,
+        max_concurrency: int = 4,
+    ) -> None:
         """Execute a query with multiple parameter sets.
 
+        By default the whole batch runs as one atomic ``executemany`` on a
+        single connection. With ``chunk_size`` set, ``args`` is consumed
+        lazily in chunks that run on up to ``max_concurrency`` pool
+        connections at once. Each chunk is then atomic on its own, but the
+        batch as a whole is not: if a chunk fails, chunks that already
+        finished stay committed.
+
         Parameters
         ----------
         query
@@ -308,10 +543,61 @@ class AsyncConnectionPool:
         args
             Iterable of parameter sequences.
         timeout
-            Query timeout in seconds.
+            Query timeout in seconds, applied per chunk when chunking.
+        chunk_size
+            Parameter sets per chunk. None (default) disables chunking.
+        max_concurrency
+            Maximum chunks in flight, and so connections held, at once.
+
+        Raises
+        ------
+        ValueError
+            If ``chunk_size`` or ``max_concurrency`` is less than 1.
+        Exception
+            The first chunk failure, unwrapped from the task group so callers
+            catch the same ``asyncpg`` errors with or without chunking. Any
+            concurrent failures are logged.
         """
-        async with self.aacquire() as conn:
-            await conn.executemany(query, args, timeout=timeout)
+        if chunk_size is None:
+            async with self.aacquire() as conn:
+                await conn.executemany(query, args, timeout=timeout)
+            return
+
+        if chunk_size < 1 or max_concurrency < 1:
+            msg = f"chunk_size and max_concurrency must be >= 1, got {chunk_size} and {max_concurrency}"
+            raise ValueError(msg)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def aexecute_chunk(chunk: list[Sequence[object]]) -> None:
+            try:
+                async with self.aacquire() as conn:
+                    await conn.executemany(query, chunk, timeout=timeout)
+            finally:
+                semaphore.release()
+
+        iterator = iter(args)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                while True:
+                    # Take a slot before slicing so at most max_concurrency chunks are in memory.
+                    await semaphore.acquire()
+                    chunk = list(itertools.islice(iterator, chunk_size))
+                    if not chunk:
+                        semaphore.release()
+                        break
+                    tg.create_task(aexecute_chunk(chunk))
+        except ExceptionGroup as eg:
+            # Raise what the unchunked path would. Chaining to the group would
+            # loop, since the group already contains this exception.
+            first, *others = eg.exceptions
+            if others:
+                logger.warning(
+                    "Additional chunk failures in executemany",
+                    count=len(others),
+                    errors=[repr(e) for e in others],
+                )
+            raise first from None
 
     async def afetch(self, query: str, *args: object, timeout: float | None = None) -> list[Record]:
         """Execute a query and return all rows.
@@ -393,6 +679,48 @@ class AsyncConnectionPool:
         timeout
             Operation timeout in seconds.
 
+        Returns
+        -------
+        str
+            COPY command status string.
+
+        See Also
+        --------
+        acopy_records_from_async : Stream rows from an async iterable instead
+            of materializing them all in memory first.
+        """
+        async with self.aacquire() as conn:
+            return await conn.copy_records_to_table(
+                table_name,
+                records=records,
+                columns=columns,
+                timeout=timeout,
+            )
+
+    async def acopy_records_from_async(
+        self,
+        table_name: str,
+        records: AsyncIterable[Sequence[object]],
+        columns: Sequence[str],
+        timeout: float | None = None,
+    ) -> str:
+        """Bulk copy records produced by an async iterable using PostgreSQL COPY.
+
+        asyncpg consumes the iterable while the COPY is in flight, so rows
+        fetched from another source (a cursor, a queue, an HTTP stream) are
+        encoded and sent as they arrive rather than buffered into a list.
+
+        Parameters
+        ----------
+        table_name
+            Target table name.
+        records
+            Async iterable yielding row tuples.
+        columns
+            Column names in the target table.
+        timeout
+            Operation timeout in seconds.
+
         Returns
         -------
         str
@@ -406,6 +734,25 @@ class AsyncConnectionPool:
                 timeout=timeout,
             )
 
+    def pool_stats(self) -> PoolStats:
+        """Read all pool sizes at once.
+
+        Metrics exporters should prefer this over the four ``pool_*``
+        properties: it checks initialization once and counts connected and
+        idle connections in a single pass.
+
+        Returns
+        -------
+        PoolStats
+            Current, minimum, maximum, and idle pool sizes. Current and idle
+            sizes are 0 before the pool is initialized.
+        """
+        pool_config = self._config.pool
+        if self._pool is None:
+            return PoolStats(size=0, min_size=pool_config.min_size, max_size=pool_config.max_size, idle=0)
+        size, _, idle = self._snapshot(self._pool)
+        return PoolStats(size=size, min_size=pool_config.min_size, max_size=pool_config.max_size, idle=idle)
+
     @property
     def pool_size(self) -> int:
         """Current number of connections in the pool."""
@@ -28,10 +28,15 @@ type RedisCommands = AsyncCoreCommands
 class BaseRedisClient(ABC):
     """Base class with shared Redis client logic."""
 
+    # Health results younger than this are reused, so a burst of probes costs one PING.
+    _HEALTH_CHECK_TTL_S = 1.0
+
     def __init__(self, config: RedisConfig) -> None:
         self.config = config
         self._client: RedisClientType | None = None
         self._init_lock = asyncio.Lock()
+        self._health_lock = asyncio.Lock()
+        self._health_cache: tuple[float, HealthCheckStatus] | None = None
 
     @abstractmethod
     async def ainitialize(self) -> None:
@@ -42,7 +47,30 @@ class BaseRedisClient(ABC):
         """Close the Redis client and release resources."""
 
     async def ahealth_check(self) -> HealthCheckStatus:
-        """Check Redis connection health."""
+        """Check Redis connection health.
+
+        Results are cached for ``_HEALTH_CHECK_TTL_S`` seconds, and concurrent
+        callers that miss the cache share a single in-flight PING.
+        """
+        if self._client is None:
+            return HealthCheckStatus.INITIALIZING
+
+        loop = asyncio.get_running_loop()
+        cached = self._health_cache
+        if cached is not None and loop.time() - cached[0] < self._HEALTH_CHECK_TTL_S:
+            return cached[1]
+
+        async with self._health_lock:
+            cached = self._health_cache
+            if cached is not None and loop.time() - cached[0] < self._HEALTH_CHECK_TTL_S:
+                return cached[1]
+
+            status = await self._aping()
+            self._health_cache = (loop.time(), status)
+            return status
+
+    async def _aping(self) -> HealthCheckStatus:
+        """PING the server, bypassing the health cache."""
         if self._client is None:
             return HealthCheckStatus.INITIALIZING
 
@@ -50,6 +50,10 @@ class RedisClusterClient(BaseRedisClient):
 
     async def ainitialize(self) -> None:
         """Initialize the Redis cluster client."""
+        # Fast path: skip the lock once initialized; re-checked under the lock below.
+        if self._client is not None:
+            return
+
         async with self._init_lock:
             if self._client is not None:
                 return
@@ -74,5 +78,6 @@ class RedisClusterClient(BaseRedisClient):
         if self._client is not None:
             await self._client.aclose()
             self._client = None
+            self._health_cache = None
 
         logger.info("Redis cluster client closed")
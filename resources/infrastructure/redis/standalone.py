@@ -44,6 +44,10 @@ class RedisStandaloneClient(BaseRedisClient):
 
     async def ainitialize(self) -> None:
         """Initialize the Redis standalone client with connection pool."""
+        # Fast path: skip the lock once initialized; re-checked under the lock below.
+        if self._client is not None:
+            return
+
         async with self._init_lock:
             if self._client is not None:
                 return
@@ -69,6 +73,7 @@ class RedisStandaloneClient(BaseRedisClient):
         if self._client is not None:
             await self._client.aclose()
             self._client = None
+            self._health_cache = None
 
         if self._pool is not None:
             await self._pool.aclose()
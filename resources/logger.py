@@ -12,12 +12,21 @@ from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from structlog.processors import CallsiteParameter
 
+try:
+    from opentelemetry import trace as _otel_trace
+except ImportError:
+    _otel_trace = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from structlog.types import EventDict, Processor, WrappedLogger
 
 type BoundLogger = structlog.stdlib.BoundLogger
 type LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"]
 
+# structlog renders the final string, so handlers only need a stateless
+# pass-through formatter; one instance is shared by every output strategy.
+_PASSTHROUGH_FORMATTER = logging.Formatter("%(message)s")
+
 
 class LoggingConfig(BaseSettings):
     model_config = SettingsConfigDict(
@@ -35,10 +44,12 @@ class LoggingConfig(BaseSettings):
     backup_count: int = Field(default=10, ge=0)
     library_log_levels: dict[str, LogLevel] = Field(default_factory=dict)
     enable_otel: bool = Field(default=False)
+    # Callsite lookup walks the stack on every record; logger_name usually suffices.
+    include_callsite: bool = Field(default=False)
 
 
 class FormatterStrategy(Protocol):
-    def build_processors(self, enable_otel: bool) -> list[Processor]: ...
+    def build_processors(self, enable_otel: bool, include_callsite: bool = False) -> list[Processor]: ...
 
 
 class OutputStrategy(Protocol):
@@ -50,12 +61,10 @@ def _add_otel_trace_context(
     _method_name: str,
     event_dict: EventDict,
 ) -> EventDict:
-    try:
-        from opentelemetry import trace
-    except ImportError:
+    if _otel_trace is None:
         return event_dict
 
-    current_span = trace.get_current_span()
+    current_span = _otel_trace.get_current_span()
     if current_span and current_span.is_recording():
         span_context = current_span.get_span_context()
         event_dict["trace_id"] = format(span_context.trace_id, "032x")
@@ -64,22 +73,29 @@ def _add_otel_trace_context(
     return event_dict
 
 
+def _callsite_processors(include_callsite: bool) -> list[Processor]:
+    if not include_callsite:
+        return []
+    return [
+        structlog.processors.CallsiteParameterAdder(
+            parameters=[
+                CallsiteParameter.FILENAME,
+                CallsiteParameter.LINENO,
+                CallsiteParameter.MODULE,
+            ]
+        ),
+    ]
+
+
 class JsonFormatterStrategy:
-    def build_processors(self, enable_otel: bool) -> list[Processor]:
+    def build_processors(self, enable_otel: bool, include_callsite: bool = False) -> list[Processor]:
         shared: list[Processor] = [
             structlog.contextvars.merge_contextvars,
             structlog.stdlib.add_log_level,
             structlog.stdlib.add_logger_name,
-            structlog.processors.CallsiteParameterAdder(
-                parameters=[
-                    CallsiteParameter.FILENAME,
-                    CallsiteParameter.LINENO,
-                    CallsiteParameter.MODULE,
-                ]
-            ),
+            *_callsite_processors(include_callsite),
             structlog.processors.TimeStamper(fmt="iso", utc=True),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
         ]
 
         if enable_otel:
@@ -93,21 +109,14 @@ class JsonFormatterStrategy:
 
 
 class ConsoleFormatterStrategy:
-    def build_processors(self, enable_otel: bool) -> list[Processor]:
+    def build_processors(self, enable_otel: bool, include_callsite: bool = False) -> list[Processor]:
         shared: list[Processor] = [
             structlog.contextvars.merge_contextvars,
             structlog.stdlib.add_log_level,
             structlog.stdlib.add_logger_name,
-            structlog.processors.CallsiteParameterAdder(
-                parameters=[
-                    CallsiteParameter.FILENAME,
-                    CallsiteParameter.LINENO,
-                    CallsiteParameter.MODULE,
-                ]
-            ),
+            *_callsite_processors(include_callsite),
             structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=False),
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
         ]
 
         if enable_otel:
@@ -134,7 +143,7 @@ class FileOutputStrategy:
             encoding="utf-8",
         )
         handler.setLevel(config.level)
-        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.setFormatter(_PASSTHROUGH_FORMATTER)
 
         return handler
 
@@ -143,7 +152,7 @@ class StreamOutputStrategy:
     def create_handler(self, config: LoggingConfig) -> logging.Handler:
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(config.level)
-        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler.setFormatter(_PASSTHROUGH_FORMATTER)
 
         return handler
 
@@ -153,7 +162,7 @@ class LoggerFactory:
     def create(config: LoggingConfig) -> BoundLogger:
         formatter: FormatterStrategy = JsonFormatterStrategy() if config.json_output else ConsoleFormatterStrategy()
 
-        processors = formatter.build_processors(config.enable_otel)
+        processors = formatter.build_processors(config.enable_otel, config.include_callsite)
 
         structlog.configure(
             processors=processors,
@@ -187,8 +196,14 @@ def _get_default_config() -> LoggingConfig:
 def configure_logging(config: LoggingConfig | None = None) -> None:
     actual_config = config if config is not None else _get_default_config()
     LoggerFactory.create(actual_config)
+    # Loggers handed out after a reconfigure should not be ones that may
+    # already have cached the previous configuration on first use.
+    get_logger.cache_clear()
 
 
+# structlog builds a new lazy proxy on every call; one per name is enough
+# since the proxy resolves the active configuration when first used.
+@lru_cache(maxsize=256)
 def get_logger(name: str | None = None) -> BoundLogger:
     return cast(BoundLogger, structlog.get_logger(name))
 
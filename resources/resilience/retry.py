@@ -1,39 +1,39 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine
+import inspect
+import random
+import time
+from collections.abc import Callable, Coroutine, Hashable
 from functools import wraps
-from typing import cast
+from typing import Any, Literal, cast
 
 from tenacity import (
     AsyncRetrying,
-    RetryCallState,
     Retrying,
-    after_nothing,
-    before_nothing,
-    retry_if_exception_type,
-    retry_if_not_exception_type,
     stop_after_attempt,
-    wait_random_exponential,
 )
 from tenacity.retry import retry_base
+from tenacity.wait import wait_base
 
 from ..config.retry import RetryConfig
 from ..core.types import P, R
 from .types import BeforeSleepCallback, RetryCallback
 
-from __future__ import annotations
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RetryConfig(BaseModel):
     """Configuration for retry decorator with exponential backoff and jitter.
 
-    Implements Google SRE Full Jitter algorithm for distributed systems resilience.
+    Defaults to the Full Jitter algorithm for distributed systems resilience;
+    ``jitter_mode`` selects the Equal or Decorrelated Jitter variants instead.
     See: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
     """
 
+    # Frozen so a `Retry` shared by `retry` never sees its config change.
+    model_config = ConfigDict(frozen=True)
+
     max_attempts: int = Field(default=3, ge=1, description="Maximum retry attempts")
     wait_min: float = Field(
         default=1.0, ge=0, description="Minimum wait time in seconds"
@@ -47,6 +47,13 @@ class RetryConfig(BaseModel):
     exp_base: float = Field(
         default=2.0, ge=1, description="Exponential base (Google SRE default: 2.0)"
     )
+    jitter_mode: Literal["full", "equal", "decorrelated"] = Field(
+        default="full",
+        description=(
+            "Backoff jitter: full (uniform up to the exponential cap), equal (half the cap plus"
+            " uniform jitter), decorrelated (uniform up to 3x the previous wait)"
+        ),
+    )
 
     retry_on_exceptions: tuple[type[Exception], ...] | None = Field(
         default=None,
@@ -63,8 +70,6 @@ class RetryConfig(BaseModel):
     )
 
 
-from __future__ import annotations
-
 from collections.abc import Awaitable, Callable
 
 from tenacity import RetryCallState
@@ -76,6 +81,53 @@ type BeforeSleepCallback = Callable[[RetryCallState], Awaitable[None] | None]
 class RetryLogicError(RuntimeError): ...
 
 
+# Never retried whatever ``retry_on_exceptions`` says: retrying these would
+# keep a cancelled task or an interrupted process sleeping and re-running.
+_ALWAYS_NEVER_RETRY: tuple[type[BaseException], ...] = (asyncio.CancelledError, KeyboardInterrupt, SystemExit)
+
+
+class _RetryOnExceptionTypes(retry_base):
+    """Retry on ``retry_on`` exceptions unless they are also ``never_retry_on``.
+
+    Equivalent to ``retry_if_exception_type(retry_on) &
+    retry_if_not_exception_type(never_retry_on)`` but decided with two
+    ``isinstance`` calls instead of dispatching through `retry_all`. The
+    exclusion is checked first: it is usually a handful of specific types,
+    while ``retry_on`` is often the catch-all ``Exception``.
+    """
+
+    def __init__(
+        self,
+        retry_on: tuple[type[BaseException], ...],
+        never_retry_on: tuple[type[BaseException], ...],
+    ) -> None:
+        self._retry_on = retry_on
+        self._never_retry_on = never_retry_on
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        outcome = retry_state.outcome
+        if outcome is None or not outcome.failed:
+            return False
+        exc = outcome.exception()
+        return not isinstance(exc, self._never_retry_on) and isinstance(exc, self._retry_on)
+
+
+# Stateless, so every Retry with the default exception settings shares it.
+_RETRY_ON_ANY_EXCEPTION = _RetryOnExceptionTypes((Exception,), _ALWAYS_NEVER_RETRY)
+
+
+class _JitterWait(wait_base):
+    """Tenacity wait strategy delegating to `Retry._wait_s`."""
+
+    def __init__(self, wait_s: Callable[[int, float], float]) -> None:
+        self._wait_s = wait_s
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        # tenacity keeps the last computed sleep in ``upcoming_sleep`` until
+        # this call replaces it, so it is the previous wait here.
+        return self._wait_s(retry_state.attempt_number, retry_state.upcoming_sleep)
+
+
 class Retry:
     def __init__(
         self,
@@ -90,51 +142,107 @@ class Retry:
         self._before_sleep = before_sleep
         self._stop = stop_after_attempt(config.max_attempts)
 
-        # NOTE: Google SRE Full Jitter algorithm from AWS https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
-        self._wait = wait_random_exponential(
-            multiplier=config.multiplier,
-            min=config.wait_min,
-            max=config.wait_max,
-            exp_base=config.exp_base,
+        self._wait_caps = self._build_wait_caps(config)
+        # Own generator so concurrent retries do not contend on the shared
+        # module-level one (which takes a lock on free-threaded builds).
+        self._rng = random.Random()
+        # NOTE: Jitter algorithms from AWS https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+        self._wait = _JitterWait(self._wait_s)
+        # Exception tuples shared by the tenacity retry condition and the
+        # callback-free fast path in `_wrap_async`.
+        self._retry_on: tuple[type[BaseException], ...] = config.retry_on_exceptions or (Exception,)
+        self._never_retry_on: tuple[type[BaseException], ...] = _ALWAYS_NEVER_RETRY + (config.never_retry_on or ())
+        self._retry_condition = (
+            _RETRY_ON_ANY_EXCEPTION
+            if config.retry_on_exceptions is None and not config.never_retry_on
+            else _RetryOnExceptionTypes(self._retry_on, self._never_retry_on)
         )
-        self._retry_condition = self._build_retry_condition(config)
-
-    def _build_retry_condition(self, config: RetryConfig) -> retry_base:
-        if config.retry_on_exceptions:
-            condition: retry_base = retry_if_exception_type(config.retry_on_exceptions)
-        else:
-            condition = retry_if_exception_type(Exception)
-
-        if config.never_retry_on:
-            condition = condition & retry_if_not_exception_type(config.never_retry_on)
 
-        return condition
+        # Built once and splatted into a fresh (Async)Retrying per call: a
+        # Retrying carries per-run iteration state, so instances are not shared
+        # across concurrent calls, but the arguments never change.
+        self._retrying_kwargs: dict[str, Any] = {
+            "stop": self._stop,
+            "wait": self._wait,
+            "retry": self._retry_condition,
+            # None, unlike before_nothing/after_nothing, makes tenacity skip
+            # queueing the callback on every attempt.
+            "before": self._before,
+            "after": self._after,
+            "before_sleep": self._before_sleep,
+            "reraise": config.reraise,
+        }
+
+        # Without callbacks nobody observes RetryCallState; with reraise=True
+        # the original exception surfaces as-is, so tenacity can be bypassed.
+        self._bypass_tenacity = before is None and after is None and before_sleep is None and config.reraise
+
+    @staticmethod
+    def _build_wait_caps(config: RetryConfig) -> tuple[float, ...]:
+        """Exponential window caps for each retry, stopping once they stop growing.
+
+        Entry ``i`` is the clamped ``multiplier * exp_base ** i`` used before
+        attempt ``i + 2``; the sequence is non-decreasing, so once it reaches
+        ``wait_max`` or repeats, the last entry holds for all later attempts.
+        """
+        floor = max(0.0, config.wait_min)
+        caps: list[float] = []
+        # Always build at least one cap: tenacity computes the wait before it
+        # checks stop, so even ``max_attempts=1`` asks for the first one.
+        for attempt_number in range(1, max(config.max_attempts, 2)):
+            try:
+                high = config.multiplier * config.exp_base ** (attempt_number - 1)
+            except OverflowError:
+                high = config.wait_max
+            cap = max(floor, min(high, config.wait_max))
+            caps.append(cap)
+            if cap >= config.wait_max or (len(caps) > 1 and caps[-2] == cap):
+                break
+        return tuple(caps)
+
+    def _wait_s(self, attempt_number: int, previous_s: float = 0.0) -> float:
+        """Jittered delay after ``attempt_number`` for the configured ``jitter_mode``.
+
+        ``previous_s`` is the delay slept before this attempt (0 before the
+        first retry) and only feeds decorrelated jitter. Full jitter matches
+        tenacity's `wait_random_exponential`.
+        """
+        config = self._config
+        low = config.wait_min
+        if config.jitter_mode == "decorrelated":
+            # The first window is ``multiplier`` wide, as with full jitter.
+            high = max(low, config.multiplier, previous_s * 3)
+            return min(config.wait_max, low + self._rng.random() * (high - low))
+
+        caps = self._wait_caps
+        high = caps[min(attempt_number, len(caps)) - 1]
+        if config.jitter_mode == "equal":
+            half = high / 2
+            return max(low, half + self._rng.random() * half)
+        return low + self._rng.random() * (high - low)
 
     def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
-        if asyncio.iscoroutinefunction(func):
+        # A single attempt with nothing observing it is just the call itself.
+        if self._bypass_tenacity and self._config.max_attempts == 1:
+            return func
+        if inspect.iscoroutinefunction(func):
             return cast(Callable[P, R], self._wrap_async(func))
         return self._wrap_sync(func)
 
     def _wrap_async(
         self, func: Callable[P, Coroutine[object, object, R]]
     ) -> Callable[P, Coroutine[object, object, R]]:
+        # NOTE: A plain loop replaces AsyncRetrying and the success path costs
+        # one try/except. reraise=False needs tenacity's RetryError, so it
+        # keeps the tenacity path.
+        if self._bypass_tenacity:
+            return self._wrap_async_fast(func)
+
+        retrying_kwargs = self._retrying_kwargs
+
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            async for attempt in AsyncRetrying(
-                stop=self._stop,
-                wait=self._wait,
-                retry=self._retry_condition,
-                before=cast(
-                    Callable[[RetryCallState], Awaitable[None] | None],
-                    self._before or before_nothing,
-                ),
-                after=cast(
-                    Callable[[RetryCallState], Awaitable[None] | None],
-                    self._after or after_nothing,
-                ),
-                before_sleep=self._before_sleep,
-                reraise=self._config.reraise,
-            ):
+            async for attempt in AsyncRetrying(**retrying_kwargs):
                 with attempt:
                     return await func(*args, **kwargs)
 
@@ -144,27 +252,42 @@ class Retry:
 
         return wrapper
 
+    def _wrap_async_fast(
+        self, func: Callable[P, Coroutine[object, object, R]]
+    ) -> Callable[P, Coroutine[object, object, R]]:
+        max_attempts = self._config.max_attempts
+        retry_on = self._retry_on
+        never_retry_on = self._never_retry_on
+        next_wait_s = self._wait_s
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            wait_s = 0.0
+            for attempt_number in range(1, max_attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on as e:
+                    if isinstance(e, never_retry_on) or attempt_number == max_attempts:
+                        raise
+                    wait_s = next_wait_s(attempt_number, wait_s)
+                    await asyncio.sleep(wait_s)
+
+            raise RetryLogicError(
+                "Async retry loop completed without success or failure"
+            )
+
+        return wrapper
+
     def _wrap_sync(self, func: Callable[P, R]) -> Callable[P, R]:
+        # Same bypass as `_wrap_async`, with a blocking sleep between attempts.
+        if self._bypass_tenacity:
+            return self._wrap_sync_fast(func)
+
+        retrying_kwargs = self._retrying_kwargs
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            for attempt in Retrying(
-                stop=self._stop,
-                wait=self._wait,
-                retry=self._retry_condition,
-                before=cast(
-                    Callable[[RetryCallState], None],
-                    self._before or before_nothing,
-                ),
-                after=cast(
-                    Callable[[RetryCallState], None],
-                    self._after or after_nothing,
-                ),
-                before_sleep=cast(
-                    Callable[[RetryCallState], None] | None,
-                    self._before_sleep,
-                ),
-                reraise=self._config.reraise,
-            ):
+            for attempt in Retrying(**retrying_kwargs):
                 with attempt:
                     return func(*args, **kwargs)
 
@@ -174,6 +297,36 @@ class Retry:
 
         return wrapper
 
+    def _wrap_sync_fast(self, func: Callable[P, R]) -> Callable[P, R]:
+        max_attempts = self._config.max_attempts
+        retry_on = self._retry_on
+        never_retry_on = self._never_retry_on
+        next_wait_s = self._wait_s
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            wait_s = 0.0
+            for attempt_number in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except retry_on as e:
+                    if isinstance(e, never_retry_on) or attempt_number == max_attempts:
+                        raise
+                    wait_s = next_wait_s(attempt_number, wait_s)
+                    time.sleep(wait_s)
+
+            raise RetryLogicError(
+                "Sync retry loop completed without success or failure"
+            )
+
+        return wrapper
+
+
+# Callback-free `Retry` instances shared by `retry`, keyed by config type
+# and field values. Bounded so configs built on the fly cannot grow it forever.
+_SHARED_RETRIES: dict[tuple[Hashable, ...], Retry] = {}
+_SHARED_RETRIES_MAX = 128
+
 
 def retry(
     config: RetryConfig | None = None,
@@ -182,4 +335,23 @@ def retry(
     before_sleep: BeforeSleepCallback | None = None,
 ) -> Retry:
     retry_config = config or RetryConfig()
-    return Retry(retry_config, before, after, before_sleep)
+    # Callbacks are often closures or bound methods, so caching them would keep
+    # them (and whatever they close over) alive; only callback-free decorators
+    # are shared. A Retry holds no per-call state, so sharing one is safe.
+    if before is not None or after is not None or before_sleep is not None:
+        return Retry(retry_config, before, after, before_sleep)
+
+    key: tuple[Hashable, ...] = (
+        type(retry_config),
+        *(getattr(retry_config, name) for name in type(retry_config).model_fields),
+    )
+    try:
+        shared = _SHARED_RETRIES.get(key)
+    except TypeError:
+        # A subclass added an unhashable field: build a fresh Retry instead.
+        return Retry(retry_config)
+    if shared is None:
+        shared = Retry(retry_config)
+        if len(_SHARED_RETRIES) < _SHARED_RETRIES_MAX:
+            _SHARED_RETRIES[key] = shared
+    return shared
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import fcntl
+import json
 import os
 import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import asyncpg
 import pytest
 import pytest_asyncio
 from docker import from_env  # type: ignore[import-untyped]
@@ -25,9 +33,17 @@ from .replication_fixtures import (  # noqa: F401
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Iterator
 
-    from leitmotif.infrastructure.postgres import AsyncConnectionPool
+    from leitmotif.infrastructure.postgres import AsyncConnectionPool, AsyncpgConfig, AsyncpgConnectionSettings
 
 TEST_USERS_TABLE = "test_users"
+TEST_RECOVERY_TABLE = "test_recovery"
+POSTGRES_IMAGE = "postgres:17-alpine"
+# Test data is disposable, so skip the flushes that make commits crash-safe;
+# otherwise every commit and DDL statement waits on a WAL fsync.
+POSTGRES_COMMAND = ["postgres", "-c", "fsync=off", "-c", "synchronous_commit=off", "-c", "full_page_writes=off"]
+# How long the xdist worker that started the shared container waits for the
+# other workers to finish with it before stopping it anyway.
+SHARED_CONTAINER_RELEASE_TIMEOUT_S = 600.0
 
 
 def pytest_configure(config: pytest.Config) -> None:  # noqa: ARG001
@@ -52,6 +68,7 @@ def pytest_configure(config: pytest.Config) -> None:  # noqa: ARG001
         os.environ["TESTCONTAINERS_RYUK_DISABLED"] = "true"
 
 
+@lru_cache(maxsize=1)
 def _is_docker_available() -> bool:
     """Check if Docker daemon is accessible.
 
@@ -75,71 +92,310 @@ def _is_docker_available() -> bool:
         return True
 
 
+@dataclass(frozen=True, slots=True)
+class SharedPostgresContainer:
+    """Connection details for a PostgreSQL container shared by xdist workers.
+
+    Exposes the subset of `PostgresContainer` that fixtures and tests use, so
+    it can stand in for the container object wherever one is expected.
+    """
+
+    host: str
+    port: int
+    dbname: str
+    username: str
+    password: str
+
+    def get_container_host_ip(self) -> str:
+        return self.host
+
+    def get_exposed_port(self, port: int) -> int:  # noqa: ARG002
+        return self.port
+
+
+def _create_postgres_container() -> PostgresContainer:
+    """Create the (unstarted) PostgreSQL container used by the suite."""
+    container = PostgresContainer(POSTGRES_IMAGE, driver="asyncpg")
+    container.with_command(POSTGRES_COMMAND)  # type: ignore[misc]
+    return container
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive ``flock`` on ``lock_path``, serializing xdist workers."""
+    with lock_path.open("a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+async def _acreate_database(container: SharedPostgresContainer, admin_database: str) -> None:
+    conn = await asyncpg.connect(
+        host=container.host,
+        port=container.port,
+        user=container.username,
+        password=container.password,
+        database=admin_database,
+    )
+    try:
+        await conn.execute(f'CREATE DATABASE "{container.dbname}"')
+    finally:
+        await conn.close()
+
+
+def _shared_postgres_container(root: Path, worker_id: str) -> Iterator[SharedPostgresContainer]:
+    """Share one container across xdist workers, with a database per worker.
+
+    The first worker to take the lock starts the container and records its
+    connection details and a user count in a state file; later workers read
+    it instead of starting their own. The starting worker owns the container
+    (and testcontainers' reaper connection), so on teardown it waits for the
+    count to reach zero before stopping it. Each worker gets its own database
+    because tests assume exclusive use of their tables.
+    """
+    lock_path = root / "postgres_container.lock"
+    state_path = root / "postgres_container.json"
+    owned: PostgresContainer | None = None
+
+    with _exclusive_lock(lock_path):
+        if state_path.exists():
+            state = json.loads(state_path.read_text())
+        else:
+            owned = _create_postgres_container().start()
+            state = {
+                "host": owned.get_container_host_ip(),
+                "port": int(owned.get_exposed_port(5432)),
+                "dbname": owned.dbname,
+                "username": owned.username,
+                "password": owned.password,
+                "users": 0,
+            }
+        state["users"] += 1
+        state_path.write_text(json.dumps(state))
+
+    container = SharedPostgresContainer(
+        host=state["host"],
+        port=state["port"],
+        dbname=f"test_{worker_id}",
+        username=state["username"],
+        password=state["password"],
+    )
+    asyncio.run(_acreate_database(container, admin_database=state["dbname"]))
+
+    try:
+        yield container
+    finally:
+        with _exclusive_lock(lock_path):
+            state = json.loads(state_path.read_text())
+            state["users"] -= 1
+            state_path.write_text(json.dumps(state))
+
+        if owned is not None:
+            deadline = time.monotonic() + SHARED_CONTAINER_RELEASE_TIMEOUT_S
+            while True:
+                with _exclusive_lock(lock_path):
+                    state = json.loads(state_path.read_text())
+                    if state["users"] <= 0 or time.monotonic() >= deadline:
+                        # Workers arriving after this start a fresh container.
+                        state_path.unlink()
+                        break
+                time.sleep(0.5)
+            owned.stop()
+
+
 @pytest.fixture(scope="session")
-def postgres_container() -> Iterator[PostgresContainer]:
+def postgres_container(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[PostgresContainer | SharedPostgresContainer]:
     """Provide session-scoped PostgreSQL container.
 
     Yields
     ------
-    PostgresContainer
-        Running PostgreSQL container instance.
+    PostgresContainer | SharedPostgresContainer
+        Running PostgreSQL container instance, or under pytest-xdist the
+        connection details of one container shared by all workers.
 
     Notes
     -----
     Uses context manager for automatic cleanup. The `driver="asyncpg"` parameter
-    optimizes connection handling for asyncpg-based pools.
+    optimizes connection handling for asyncpg-based pools. Under pytest-xdist a
+    single container is shared by all workers, each with its own database.
 
     """
     if not _is_docker_available():
         pytest.skip("Docker daemon not accessible")
 
-    with PostgresContainer("postgres:17-alpine", driver="asyncpg") as container:
-        yield container
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id is None:
+        with _create_postgres_container() as container:
+            yield container
+        return
 
+    # getbasetemp() is per worker; its parent is shared by the whole run.
+    yield from _shared_postgres_container(tmp_path_factory.getbasetemp().parent, worker_id)
 
-@pytest_asyncio.fixture
-async def asyncpg_pool(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
-    """Provide async connection pool for tests.
 
-    Creates a fresh pool for each test function using container's
-    dynamically assigned credentials.
+@pytest.fixture(scope="session")
+def test_schema(postgres_container: PostgresContainer | SharedPostgresContainer) -> None:
+    """Create the test schema once per session.
 
-    Yields
-    ------
-    AsyncConnectionPool
-        Initialized connection pool instance.
+    The DDL runs on its own short-lived connection so it does not need a
+    pool or an event loop shared with the function-scoped fixtures. Tests
+    isolate their data via `_cleanup_test_users` emptying the table.
+
+    """
+    asyncio.run(_initialize_test_schema(postgres_container))
+
+
+@pytest.fixture(scope="session")
+def postgres_connection_settings(
+    postgres_container: PostgresContainer | SharedPostgresContainer,
+) -> AsyncpgConnectionSettings:
+    """Provide connection settings for the session's PostgreSQL database.
+
+    Resolved once per session: looking up the container's host and mapped
+    port queries the Docker API, and every pool fixture needs them.
+
+    Returns
+    -------
+    AsyncpgConnectionSettings
+        Settings pointing at the container's database.
 
+    """
+    from leitmotif.infrastructure.postgres import AsyncpgConnectionSettings
+
+    return AsyncpgConnectionSettings(
+        host=postgres_container.get_container_host_ip(),
+        port=int(postgres_container.get_exposed_port(5432)),
+        database=postgres_container.dbname,
+        user=postgres_container.username,
+        password=SecretStr(postgres_container.password),
+    )
+
+
+_POOL_CONFIGS: dict[tuple[object, ...], AsyncpgConfig] = {}
+
+
+def _pool_config(
+    connection: AsyncpgConnectionSettings,
+    *,
+    min_size: int,
+    max_size: int,
+    command_timeout: float,
+    application_name: str,
+) -> AsyncpgConfig:
+    """Build (once per distinct argument set) the config for a test pool.
+
+    The function-scoped pool fixtures reuse one validated config per session
+    instead of re-running pydantic validation for every test. The settings
+    models are not hashable, so the key is spelled out from their fields.
     """
     from leitmotif.infrastructure.postgres import (
-        AsyncConnectionPool,
         AsyncpgConfig,
-        AsyncpgConnectionSettings,
         AsyncpgPoolSettings,
         AsyncpgServerSettings,
         AsyncpgStatementCacheSettings,
     )
 
-    config = AsyncpgConfig(
-        connection=AsyncpgConnectionSettings(
-            host=postgres_container.get_container_host_ip(),
-            port=int(postgres_container.get_exposed_port(5432)),
-            database=postgres_container.dbname,
-            user=postgres_container.username,
-            password=SecretStr(postgres_container.password),
-        ),
-        pool=AsyncpgPoolSettings(min_size=2, max_size=10, command_timeout=60.0),
-        statement_cache=AsyncpgStatementCacheSettings(max_size=128),
-        server_settings=AsyncpgServerSettings(application_name="leitmotif_test", jit="off"),
+    key = (
+        connection.host,
+        connection.port,
+        connection.database,
+        connection.user,
+        connection.password,
+        min_size,
+        max_size,
+        command_timeout,
+        application_name,
+    )
+    if (config := _POOL_CONFIGS.get(key)) is None:
+        config = AsyncpgConfig(
+            connection=connection,
+            pool=AsyncpgPoolSettings(min_size=min_size, max_size=max_size, command_timeout=command_timeout),
+            statement_cache=AsyncpgStatementCacheSettings(max_size=128),
+            server_settings=AsyncpgServerSettings(application_name=application_name, jit="off"),
+        )
+        _POOL_CONFIGS[key] = config
+    return config
+
+
+def _make_pool(
+    connection: AsyncpgConnectionSettings,
+    *,
+    min_size: int,
+    max_size: int,
+    command_timeout: float,
+    application_name: str,
+) -> AsyncConnectionPool:
+    """Build an uninitialized pool against the test database.
+
+    The pool fixtures differ only in sizing, command timeout and application
+    name; open the result with ``async with``.
+
+    Parameters
+    ----------
+    connection
+        Connection settings from `postgres_connection_settings`.
+    min_size, max_size
+        Pool size bounds.
+    command_timeout
+        Default per-statement timeout in seconds.
+    application_name
+        ``application_name`` reported to the server, to tell pools apart.
+
+    Returns
+    -------
+    AsyncConnectionPool
+        Pool that connects when entered.
+
+    """
+    from leitmotif.infrastructure.postgres import AsyncConnectionPool
+
+    config = _pool_config(
+        connection,
+        min_size=min_size,
+        max_size=max_size,
+        command_timeout=command_timeout,
+        application_name=application_name,
     )
+    return AsyncConnectionPool(config)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def asyncpg_pool(
+    postgres_connection_settings: AsyncpgConnectionSettings,
+    test_schema: None,  # noqa: ARG001
+) -> AsyncIterator[AsyncConnectionPool]:
+    """Provide async connection pool for tests.
 
-    async with AsyncConnectionPool(config) as pool:
-        await _initialize_test_schema(pool)
+    One pool per session, using the container's dynamically assigned
+    credentials, so tests do not each pay for connecting ``min_size``
+    connections. The schema is created once per session by `test_schema`
+    and `_cleanup_test_users` empties the table before each test. Tests
+    run on the session event loop (``asyncio_default_test_loop_scope``)
+    that opened the pool.
+
+    Yields
+    ------
+    AsyncConnectionPool
+        Initialized connection pool instance.
+
+    """
+    async with _make_pool(
+        postgres_connection_settings,
+        min_size=2,
+        max_size=10,
+        command_timeout=60.0,
+        application_name="leitmotif_test",
+    ) as pool:
         yield pool
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
 async def _cleanup_test_users(asyncpg_pool: AsyncConnectionPool) -> None:
-    """Truncate test_users table before each test for isolation.
+    """Empty the test_users table before each test for isolation.
 
     This fixture uses pytest's autouse mechanism to run automatically before
     every test that uses the `asyncpg_pool` fixture.
@@ -157,8 +413,8 @@ async def _cleanup_test_users(asyncpg_pool: AsyncConnectionPool) -> None:
        - Detects this autouse fixture depends on `asyncpg_pool`
        - Automatically runs this fixture BEFORE the test executes
 
-    4. Tests that don't use `asyncpg_pool` (like TestPoolLifecycle tests that
-       create their own pools) won't trigger this fixture.
+    4. Because it is autouse in this conftest, it applies to every test in
+       this directory, so every test here depends on `asyncpg_pool`.
 
     Why this pattern
     ----------------
@@ -172,22 +428,34 @@ async def _cleanup_test_users(asyncpg_pool: AsyncConnectionPool) -> None:
         The connection pool fixture. This parameter creates an implicit
         dependency - pytest only runs this fixture for tests using asyncpg_pool.
     """
-    async with asyncpg_pool.aacquire() as conn:
-        await conn.execute(f"TRUNCATE TABLE {TEST_USERS_TABLE} RESTART IDENTITY CASCADE")
+    # DELETE on a table this small is cheaper than TRUNCATE, which takes an
+    # ACCESS EXCLUSIVE lock and swaps in a new relation file on every call.
+    # Sent without arguments, both statements go in one round trip.
+    await asyncpg_pool.aexecute(f"DELETE FROM {TEST_USERS_TABLE}; ALTER SEQUENCE {TEST_USERS_TABLE}_id_seq RESTART")
 
 
-async def _initialize_test_schema(pool: AsyncConnectionPool) -> None:
+async def _initialize_test_schema(container: PostgresContainer | SharedPostgresContainer) -> None:
     """Initialize test database schema.
 
-    Creates the test_users table with proper schema and indexes.
+    Creates the test_users table with proper schema and indexes, and the
+    test_recovery table used by the connection failure recovery tests.
 
     Parameters
     ----------
-    pool
-        Initialized connection pool.
+    container
+        Container (or shared container details) whose database to initialize.
 
     """
-    async with pool.aacquire() as conn:
+    conn = await asyncpg.connect(
+        host=container.get_container_host_ip(),
+        port=int(container.get_exposed_port(5432)),
+        user=container.username,
+        password=container.password,
+        database=container.dbname,
+    )
+    try:
+        # Without arguments asyncpg uses the simple query protocol, so the
+        # whole script runs in one round trip.
         await conn.execute(f"""
             CREATE TABLE IF NOT EXISTS {TEST_USERS_TABLE} (
                 id SERIAL PRIMARY KEY,
@@ -195,16 +463,21 @@ async def _initialize_test_schema(pool: AsyncConnectionPool) -> None:
                 email VARCHAR(255) UNIQUE NOT NULL,
                 age INTEGER NOT NULL CHECK (age >= 0 AND age <= 150),
                 created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_{TEST_USERS_TABLE}_age ON {TEST_USERS_TABLE}(age);
+            CREATE INDEX IF NOT EXISTS idx_{TEST_USERS_TABLE}_username ON {TEST_USERS_TABLE}(username);
+            CREATE TABLE IF NOT EXISTS {TEST_RECOVERY_TABLE} (
+                id SERIAL PRIMARY KEY,
+                value INTEGER,
+                created_at TIMESTAMP DEFAULT NOW()
+            );
         """)
-        await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TEST_USERS_TABLE}_age ON {TEST_USERS_TABLE}(age)")
-        await conn.execute(
-            f"CREATE INDEX IF NOT EXISTS idx_{TEST_USERS_TABLE}_username ON {TEST_USERS_TABLE}(username)"
-        )
+    finally:
+        await conn.close()
 
 
-@pytest_asyncio.fixture
-async def small_pool(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
+@pytest_asyncio.fixture(loop_scope="session")
+async def small_pool(postgres_connection_settings: AsyncpgConnectionSettings) -> AsyncIterator[AsyncConnectionPool]:
     """Provide small pool for exhaustion testing.
 
     Pool configuration optimized for testing pool limits:
@@ -218,34 +491,18 @@ async def small_pool(postgres_container: PostgresContainer) -> AsyncIterator[Asy
         Small initialized pool for exhaustion scenarios.
 
     """
-    from leitmotif.infrastructure.postgres import (
-        AsyncConnectionPool,
-        AsyncpgConfig,
-        AsyncpgConnectionSettings,
-        AsyncpgPoolSettings,
-        AsyncpgServerSettings,
-        AsyncpgStatementCacheSettings,
-    )
-
-    config = AsyncpgConfig(
-        connection=AsyncpgConnectionSettings(
-            host=postgres_container.get_container_host_ip(),
-            port=int(postgres_container.get_exposed_port(5432)),
-            database=postgres_container.dbname,
-            user=postgres_container.username,
-            password=SecretStr(postgres_container.password),
-        ),
-        pool=AsyncpgPoolSettings(min_size=1, max_size=3, command_timeout=30.0),
-        statement_cache=AsyncpgStatementCacheSettings(max_size=128),
-        server_settings=AsyncpgServerSettings(application_name="leitmotif_test_small", jit="off"),
-    )
-
-    async with AsyncConnectionPool(config) as pool:
+    async with _make_pool(
+        postgres_connection_settings,
+        min_size=1,
+        max_size=3,
+        command_timeout=30.0,
+        application_name="leitmotif_test_small",
+    ) as pool:
         yield pool
 
 
-@pytest_asyncio.fixture
-async def dynamic_pool(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
+@pytest_asyncio.fixture(loop_scope="session")
+async def dynamic_pool(postgres_connection_settings: AsyncpgConnectionSettings) -> AsyncIterator[AsyncConnectionPool]:
     """Provide pool for size dynamics testing.
 
     Pool configuration for testing scaling behavior:
@@ -259,34 +516,18 @@ async def dynamic_pool(postgres_container: PostgresContainer) -> AsyncIterator[A
         Dynamic pool for scaling scenarios.
 
     """
-    from leitmotif.infrastructure.postgres import (
-        AsyncConnectionPool,
-        AsyncpgConfig,
-        AsyncpgConnectionSettings,
-        AsyncpgPoolSettings,
-        AsyncpgServerSettings,
-        AsyncpgStatementCacheSettings,
-    )
-
-    config = AsyncpgConfig(
-        connection=AsyncpgConnectionSettings(
-            host=postgres_container.get_container_host_ip(),
-            port=int(postgres_container.get_exposed_port(5432)),
-            database=postgres_container.dbname,
-            user=postgres_container.username,
-            password=SecretStr(postgres_container.password),
-        ),
-        pool=AsyncpgPoolSettings(min_size=2, max_size=10, command_timeout=60.0),
-        statement_cache=AsyncpgStatementCacheSettings(max_size=128),
-        server_settings=AsyncpgServerSettings(application_name="leitmotif_test_dynamic", jit="off"),
-    )
-
-    async with AsyncConnectionPool(config) as pool:
+    async with _make_pool(
+        postgres_connection_settings,
+        min_size=2,
+        max_size=10,
+        command_timeout=60.0,
+        application_name="leitmotif_test_dynamic",
+    ) as pool:
         yield pool
 
 
-@pytest_asyncio.fixture
-async def timeout_pool(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
+@pytest_asyncio.fixture(loop_scope="session")
+async def timeout_pool(postgres_connection_settings: AsyncpgConnectionSettings) -> AsyncIterator[AsyncConnectionPool]:
     """Provide pool with short command timeout for timeout testing.
 
     Pool configuration for testing timeout behavior:
@@ -299,34 +540,18 @@ async def timeout_pool(postgres_container: PostgresContainer) -> AsyncIterator[A
         Pool configured for timeout testing.
 
     """
-    from leitmotif.infrastructure.postgres import (
-        AsyncConnectionPool,
-        AsyncpgConfig,
-        AsyncpgConnectionSettings,
-        AsyncpgPoolSettings,
-        AsyncpgServerSettings,
-        AsyncpgStatementCacheSettings,
-    )
-
-    config = AsyncpgConfig(
-        connection=AsyncpgConnectionSettings(
-            host=postgres_container.get_container_host_ip(),
-            port=int(postgres_container.get_exposed_port(5432)),
-            database=postgres_container.dbname,
-            user=postgres_container.username,
-            password=SecretStr(postgres_container.password),
-        ),
-        pool=AsyncpgPoolSettings(min_size=2, max_size=5, command_timeout=2.0),
-        statement_cache=AsyncpgStatementCacheSettings(max_size=128),
-        server_settings=AsyncpgServerSettings(application_name="leitmotif_test_timeout", jit="off"),
-    )
-
-    async with AsyncConnectionPool(config) as pool:
+    async with _make_pool(
+        postgres_connection_settings,
+        min_size=2,
+        max_size=5,
+        command_timeout=2.0,
+        application_name="leitmotif_test_timeout",
+    ) as pool:
         yield pool
 
 
-@pytest_asyncio.fixture
-async def conflict_pool(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
+@pytest_asyncio.fixture(loop_scope="session")
+async def conflict_pool(postgres_connection_settings: AsyncpgConnectionSettings) -> AsyncIterator[AsyncConnectionPool]:
     """Provide pool for transaction conflict testing.
 
     Pool configuration for testing concurrent transactions:
@@ -340,42 +565,29 @@ async def conflict_pool(postgres_container: PostgresContainer) -> AsyncIterator[
         Pool configured for transaction conflict testing.
 
     """
-    from leitmotif.infrastructure.postgres import (
-        AsyncConnectionPool,
-        AsyncpgConfig,
-        AsyncpgConnectionSettings,
-        AsyncpgPoolSettings,
-        AsyncpgServerSettings,
-        AsyncpgStatementCacheSettings,
-    )
-
-    config = AsyncpgConfig(
-        connection=AsyncpgConnectionSettings(
-            host=postgres_container.get_container_host_ip(),
-            port=int(postgres_container.get_exposed_port(5432)),
-            database=postgres_container.dbname,
-            user=postgres_container.username,
-            password=SecretStr(postgres_container.password),
-        ),
-        pool=AsyncpgPoolSettings(min_size=2, max_size=10, command_timeout=30.0),
-        statement_cache=AsyncpgStatementCacheSettings(max_size=128),
-        server_settings=AsyncpgServerSettings(application_name="leitmotif_test_conflict", jit="off"),
-    )
-
-    async with AsyncConnectionPool(config) as pool:
+    async with _make_pool(
+        postgres_connection_settings,
+        min_size=2,
+        max_size=10,
+        command_timeout=30.0,
+        application_name="leitmotif_test_conflict",
+    ) as pool:
         yield pool
 
 
-@pytest_asyncio.fixture
-async def recovery_pool(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
-    """Provide pool for connection failure recovery testing.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _recovery_session_pool(
+    postgres_connection_settings: AsyncpgConnectionSettings,
+    test_schema: None,  # noqa: ARG001
+) -> AsyncIterator[AsyncConnectionPool]:
+    """Provide the session-scoped pool behind `recovery_pool`.
 
     Pool configuration for testing failure recovery:
     - min_size: 2
     - max_size: 5
     - command_timeout: 10.0s
 
-    Creates test_recovery table for recovery tests.
+    The test_recovery table is created once per session by `test_schema`.
 
     Yields
     ------
@@ -383,40 +595,31 @@ async def recovery_pool(postgres_container: PostgresContainer) -> AsyncIterator[
         Pool configured for recovery testing.
 
     """
-    from leitmotif.infrastructure.postgres import (
-        AsyncConnectionPool,
-        AsyncpgConfig,
-        AsyncpgConnectionSettings,
-        AsyncpgPoolSettings,
-        AsyncpgServerSettings,
-        AsyncpgStatementCacheSettings,
-    )
+    async with _make_pool(
+        postgres_connection_settings,
+        min_size=2,
+        max_size=5,
+        command_timeout=10.0,
+        application_name="leitmotif_test_recovery",
+    ) as pool:
+        yield pool
 
-    config = AsyncpgConfig(
-        connection=AsyncpgConnectionSettings(
-            host=postgres_container.get_container_host_ip(),
-            port=int(postgres_container.get_exposed_port(5432)),
-            database=postgres_container.dbname,
-            user=postgres_container.username,
-            password=SecretStr(postgres_container.password),
-        ),
-        pool=AsyncpgPoolSettings(min_size=2, max_size=5, command_timeout=10.0),
-        statement_cache=AsyncpgStatementCacheSettings(max_size=128),
-        server_settings=AsyncpgServerSettings(application_name="leitmotif_test_recovery", jit="off"),
-    )
 
-    async with AsyncConnectionPool(config) as pool:
-        # Create test table for recovery tests
-        async with pool.aacquire() as conn:
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS test_recovery (
-                    id SERIAL PRIMARY KEY,
-                    value INTEGER,
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-        try:
-            yield pool
-        finally:
-            async with pool.aacquire() as conn:
-                await conn.execute("DROP TABLE IF EXISTS test_recovery CASCADE")
+@pytest_asyncio.fixture(loop_scope="session")
+async def recovery_pool(_recovery_session_pool: AsyncConnectionPool) -> AsyncConnectionPool:
+    """Provide pool for connection failure recovery testing.
+
+    Empties test_recovery before each test instead of creating and dropping
+    the table around it, so the per-test cost is one DELETE rather than
+    catalog-writing DDL.
+
+    Returns
+    -------
+    AsyncConnectionPool
+        Pool configured for recovery testing.
+
+    """
+    await _recovery_session_pool.aexecute(
+        f"DELETE FROM {TEST_RECOVERY_TABLE}; ALTER SEQUENCE {TEST_RECOVERY_TABLE}_id_seq RESTART"
+    )
+    return _recovery_session_pool
@@ -496,11 +496,9 @@ async def _initialize_test_schema(pool: AsyncConnectionPool) -> None:
             id SERIAL PRIMARY KEY,
             data TEXT NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    await pool.aexecute("""
+        );
         CREATE INDEX IF NOT EXISTS idx_test_replication_data
-        ON test_replication(data)
+        ON test_replication(data);
     """)
 
 
@@ -570,7 +568,7 @@ def replica_container(
     container.stop()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def database_cluster(
     primary_container: PostgresPrimaryContainer,
     replica_container: PostgresReplicaContainer,
@@ -611,7 +609,7 @@ async def database_cluster(
         await cluster.primary.aexecute("TRUNCATE TABLE test_replication RESTART IDENTITY")
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def multi_replica_cluster(
     primary_container: PostgresPrimaryContainer,
 ) -> AsyncIterator[DatabaseCluster]:
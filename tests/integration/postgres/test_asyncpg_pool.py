@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 import asyncpg
@@ -9,11 +11,15 @@ from leitmotif.infrastructure.postgres import (
     AsyncConnectionPool,
     HealthCheckResult,
     PoolNotInitializedError,
+    PoolStats,
 )
 from leitmotif.infrastructure.postgres.enums import HealthStatus
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from asyncpg import Record
+    from asyncpg.pool import PoolConnectionProxy
     from testcontainers.postgres import PostgresContainer
 
 
@@ -157,6 +163,90 @@ class TestBulkOperations:
         assert users[-1]["username"] == "eve"
         assert users[-1]["age"] == 45
 
+    async def test_executemany_chunked_inserts_all_rows(self, asyncpg_pool: AsyncConnectionPool) -> None:
+        """Test chunked executemany consumes a lazy iterable and inserts every row."""
+        batch_data = ((f"user{i}", f"user{i}@example.com", i) for i in range(25))
+
+        await asyncpg_pool.aexecutemany(
+            "INSERT INTO test_users (username, email, age) VALUES ($1, $2, $3)",
+            batch_data,
+            chunk_size=4,
+            max_concurrency=2,
+        )
+
+        count: int = await asyncpg_pool.afetchval("SELECT COUNT(*) FROM test_users")
+        assert count == 25
+
+    async def test_executemany_chunked_respects_max_concurrency(
+        self, asyncpg_pool: AsyncConnectionPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test chunked executemany never holds more than max_concurrency connections."""
+        original_aacquire = AsyncConnectionPool.aacquire
+        in_flight = 0
+        peak = 0
+
+        @asynccontextmanager
+        async def acounting_acquire(pool: AsyncConnectionPool) -> AsyncIterator[PoolConnectionProxy[Record]]:
+            nonlocal in_flight, peak
+            async with original_aacquire(pool) as conn:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    # Hold the connection long enough for other chunks to overlap.
+                    await asyncio.sleep(0.01)
+                    yield conn
+                finally:
+                    in_flight -= 1
+
+        monkeypatch.setattr(AsyncConnectionPool, "aacquire", acounting_acquire)
+
+        await asyncpg_pool.aexecutemany(
+            "INSERT INTO test_users (username, email, age) VALUES ($1, $2, $3)",
+            [(f"user{i}", f"user{i}@example.com", i) for i in range(20)],
+            chunk_size=2,
+            max_concurrency=3,
+        )
+
+        assert peak == 3
+        count: int = await asyncpg_pool.afetchval("SELECT COUNT(*) FROM test_users")
+        assert count == 20
+
+    @pytest.mark.parametrize(("chunk_size", "max_concurrency"), [(0, 4), (10, 0)])
+    async def test_executemany_chunked_rejects_invalid_sizes(
+        self, asyncpg_pool: AsyncConnectionPool, chunk_size: int, max_concurrency: int
+    ) -> None:
+        """Test chunked executemany rejects non-positive chunk_size and max_concurrency."""
+        with pytest.raises(ValueError, match="must be >= 1"):
+            await asyncpg_pool.aexecutemany(
+                "INSERT INTO test_users (username, email, age) VALUES ($1, $2, $3)",
+                [("alice", "alice@example.com", 25)],
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
+            )
+
+    async def test_executemany_chunked_failure_raises_first_error(self, asyncpg_pool: AsyncConnectionPool) -> None:
+        """Test a failing chunk surfaces the asyncpg error itself, not an ExceptionGroup."""
+        batch_data: list[tuple[str, str, int]] = [
+            ("alice", "alice@example.com", 25),
+            ("bob", "bob@example.com", 30),
+            ("charlie", "charlie@example.com", -1),  # age < 0 violates check constraint
+            ("diana", "diana@example.com", 40),
+        ]
+
+        with pytest.raises(asyncpg.CheckViolationError) as exc_info:
+            await asyncpg_pool.aexecutemany(
+                "INSERT INTO test_users (username, email, age) VALUES ($1, $2, $3)",
+                batch_data,
+                chunk_size=2,
+                max_concurrency=1,
+            )
+
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__
+        # Chunks are atomic on their own: the failing chunk rolled back, the first stayed.
+        usernames: list[Record] = await asyncpg_pool.afetch("SELECT username FROM test_users ORDER BY username")
+        assert [row["username"] for row in usernames] == ["alice", "bob"]
+
     async def test_copy_records_to_table(self, asyncpg_pool: AsyncConnectionPool) -> None:
         """Test bulk insert with COPY protocol."""
         records: list[tuple[object, ...]] = [
@@ -176,6 +266,24 @@ class TestBulkOperations:
         count: int = await asyncpg_pool.afetchval("SELECT COUNT(*) FROM test_users")
         assert count == 3
 
+    async def test_copy_records_from_async(self, asyncpg_pool: AsyncConnectionPool) -> None:
+        """Test bulk insert with COPY protocol from an async iterable."""
+
+        async def arecords() -> AsyncIterator[tuple[object, ...]]:
+            for i in range(1, 4):
+                yield (f"stream_user{i}", f"stream{i}@example.com", 30 + i)
+
+        result = await asyncpg_pool.acopy_records_from_async(
+            table_name="test_users",
+            records=arecords(),
+            columns=["username", "email", "age"],
+        )
+
+        assert "COPY 3" in result
+
+        count: int = await asyncpg_pool.afetchval("SELECT COUNT(*) FROM test_users")
+        assert count == 3
+
 
 @pytest.mark.asyncio
 @pytest.mark.integration
@@ -396,6 +504,9 @@ class TestPoolLifecycle:
 
         pool = AsyncConnectionPool(config)
 
+        # Stats stay readable so metrics exporters can run before startup finishes
+        assert pool.pool_stats() == PoolStats(size=0, min_size=1, max_size=5, idle=0)
+
         with pytest.raises(PoolNotInitializedError):
             await pool.afetchval("SELECT 1")
 
@@ -404,6 +515,24 @@ class TestPoolLifecycle:
         assert asyncpg_pool.pool_size >= 2
         assert asyncpg_pool.pool_max_size == 10
 
+    async def test_pool_stats_matches_size_properties(self, asyncpg_pool: AsyncConnectionPool) -> None:
+        """Test pool_stats reports the same sizes as the individual properties."""
+        stats = asyncpg_pool.pool_stats()
+
+        assert stats == PoolStats(
+            size=asyncpg_pool.pool_size,
+            min_size=asyncpg_pool.pool_min_size,
+            max_size=asyncpg_pool.pool_max_size,
+            idle=asyncpg_pool.pool_idle_size,
+        )
+        assert stats.max_size == 10
+
+        async with asyncpg_pool.aacquire():
+            held = asyncpg_pool.pool_stats()
+
+        assert held.idle == stats.idle - 1
+        assert held.size == stats.size
+
 
 @pytest.mark.asyncio
 @pytest.mark.integration
@@ -462,14 +591,15 @@ class TestComplexQueries:
 
     async def test_fetch_with_multiple_conditions(self, asyncpg_pool: AsyncConnectionPool) -> None:
         """Test fetch with complex WHERE clause."""
-        await asyncpg_pool.aexecutemany(
-            "INSERT INTO test_users (username, email, age) VALUES ($1, $2, $3)",
-            [
+        await asyncpg_pool.acopy_records_to_table(
+            table_name="test_users",
+            records=[
                 ("alice", "alice@example.com", 25),
                 ("bob", "bob@example.com", 30),
                 ("charlie", "charlie@example.com", 35),
                 ("diana", "diana@example.com", 40),
             ],
+            columns=["username", "email", "age"],
         )
 
         result: list[Record] = await asyncpg_pool.afetch(
@@ -482,13 +612,14 @@ class TestComplexQueries:
 
     async def test_fetch_with_ordering_and_limit(self, asyncpg_pool: AsyncConnectionPool) -> None:
         """Test fetch with ORDER BY and LIMIT."""
-        await asyncpg_pool.aexecutemany(
-            "INSERT INTO test_users (username, email, age) VALUES ($1, $2, $3)",
-            [
+        await asyncpg_pool.acopy_records_to_table(
+            table_name="test_users",
+            records=[
                 ("alice", "alice@example.com", 25),
                 ("bob", "bob@example.com", 30),
                 ("charlie", "charlie@example.com", 35),
             ],
+            columns=["username", "email", "age"],
         )
 
         result: list[Record] = await asyncpg_pool.afetch("SELECT username FROM test_users ORDER BY age DESC LIMIT 2")
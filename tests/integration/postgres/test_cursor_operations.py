@@ -25,7 +25,7 @@ if TYPE_CHECKING:
     from leitmotif.infrastructure.postgres import AsyncConnectionPool
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
 async def _setup_cursor_test_data(asyncpg_pool: AsyncConnectionPool) -> None:
     """Set up test data before each cursor test."""
     async with asyncpg_pool.aacquire() as conn:
@@ -16,6 +16,7 @@ not mocks, following the project's integration testing philosophy.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import uuid
 from typing import TYPE_CHECKING
 
@@ -316,6 +317,65 @@ class TestReplicaRoundRobin:
         assert sequence[1] == sequence[4] == sequence[7]
         assert sequence[2] == sequence[5] == sequence[8]
 
+    async def test_background_refresh_skips_unhealthy_replica(
+        self, multi_replica_cluster: DatabaseCluster, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The health refresher stops routing to a replica once it reports unhealthy.
+
+        Parameters
+        ----------
+        multi_replica_cluster : DatabaseCluster
+            Cluster with primary + 3 replicas.
+        monkeypatch : pytest.MonkeyPatch
+            Used to make one replica fail its health check.
+        """
+        from leitmotif.infrastructure.postgres import AsyncConnectionPool, HealthCheckResult
+
+        down = multi_replica_cluster._replicas[1]  # noqa: SLF001
+        original_ahealth_check = AsyncConnectionPool.ahealth_check
+
+        async def ahealth_check(pool: AsyncConnectionPool) -> HealthCheckResult:
+            if pool is down:
+                return HealthCheckResult.unhealthy(pool.pool_max_size, "replica down")
+            return await original_ahealth_check(pool)
+
+        monkeypatch.setattr(AsyncConnectionPool, "ahealth_check", ahealth_check)
+
+        refresher = asyncio.create_task(multi_replica_cluster._arefresh_health(0.01))  # noqa: SLF001
+        try:
+            await asyncio.sleep(0.2)
+            routed = [multi_replica_cluster.replica for _ in range(6)]
+            assert down not in routed
+            assert len({id(pool) for pool in routed}) == 2
+
+            # Once the replica passes a check again it rejoins the rotation
+            monkeypatch.undo()
+            await asyncio.sleep(0.2)
+            routed = [multi_replica_cluster.replica for _ in range(3)]
+            assert down in routed
+        finally:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+
+    async def test_health_check_keeps_rotation_when_healthy_set_unchanged(
+        self, multi_replica_cluster: DatabaseCluster
+    ) -> None:
+        """A health check that changes nothing does not restart the round robin.
+
+        Parameters
+        ----------
+        multi_replica_cluster : DatabaseCluster
+            Cluster with primary + 3 replicas.
+        """
+        first = multi_replica_cluster.replica
+
+        health = await multi_replica_cluster.ahealth_check()
+        assert health.healthy_replica_count == 3
+
+        # The rotation continues from where it was instead of starting over
+        assert [multi_replica_cluster.replica for _ in range(3)][-1] is first
+
 
 # ============================================================================
 # Test Class 5: Cluster Health Checking
@@ -402,6 +462,10 @@ class TestClusterHealthChecking:
             assert health.healthy_replica_count == 1
             assert health.total_replica_count == 2
 
+            # Routing skips the replica that failed the health check
+            healthy_replica = cluster._replicas[0]  # noqa: SLF001
+            assert all(cluster.replica is healthy_replica for _ in range(4))
+
             await cluster.aclose()
 
         finally:
@@ -419,6 +483,17 @@ class TestClusterHealthChecking:
         assert database_cluster.replica_count == 1
         assert database_cluster.has_replicas
 
+    async def test_is_replica_identifies_replica_pools(self, database_cluster: DatabaseCluster) -> None:
+        """is_replica is True for the pools .replica routes to and False for primary.
+
+        Parameters
+        ----------
+        database_cluster : DatabaseCluster
+            Cluster with primary + 1 replica.
+        """
+        assert database_cluster.is_replica(database_cluster.replica)
+        assert not database_cluster.is_replica(database_cluster.primary)
+
 
 # ============================================================================
 # Test Class 6: Fallback to Primary
@@ -451,6 +526,7 @@ class TestFallbackToPrimary:
             assert cluster.replica_count == 0
             assert not cluster.has_replicas
             assert cluster.replica is cluster.primary
+            assert not cluster.is_replica(cluster.replica)
 
             # Should work for reads
             await cluster.primary.aexecute(
@@ -15,10 +15,11 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import asyncpg
 import pytest
+from asyncpg.connection import Connection
 
 from leitmotif.infrastructure.postgres.enums import HealthStatus
 
@@ -41,6 +42,7 @@ class TestPoolExhaustion:
         4. Verify blocking using asyncio.wait_for with timeout
         """
         release_event = asyncio.Event()
+        all_acquired = asyncio.Event()
         connections_acquired = 0
 
         async def hold_connection() -> None:
@@ -48,13 +50,15 @@ class TestPoolExhaustion:
             nonlocal connections_acquired
             async with small_pool.aacquire():
                 connections_acquired += 1
+                if connections_acquired == 3:
+                    all_acquired.set()
                 await release_event.wait()
 
         # Start 3 tasks to hold all connections
         holders = [asyncio.create_task(hold_connection()) for _ in range(3)]
 
         # Wait for all 3 connections to be acquired
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(all_acquired.wait(), timeout=5.0)
         assert connections_acquired == 3, "All 3 connections should be acquired"
 
         # 4th acquire should block (timeout after 0.5 seconds)
@@ -79,9 +83,15 @@ class TestPoolExhaustion:
         """
         release_event = asyncio.Event()
         single_release = asyncio.Event()
+        all_acquired = asyncio.Event()
+        connections_acquired = 0
 
         async def hold_connection(wait_for_single: bool = False) -> None:
+            nonlocal connections_acquired
             async with small_pool.aacquire():
+                connections_acquired += 1
+                if connections_acquired == 3:
+                    all_acquired.set()
                 if wait_for_single:
                     await single_release.wait()
                 else:
@@ -92,7 +102,7 @@ class TestPoolExhaustion:
         holder2 = asyncio.create_task(hold_connection())
         holder3 = asyncio.create_task(hold_connection(wait_for_single=True))
 
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(all_acquired.wait(), timeout=5.0)
 
         # Pool exhausted - verify by attempting acquire with short timeout
         async def try_acquire() -> None:
@@ -102,9 +112,8 @@ class TestPoolExhaustion:
         with pytest.raises(asyncio.TimeoutError):
             await asyncio.wait_for(try_acquire(), timeout=0.3)
 
-        # Release one connection
+        # Release one connection; the acquire below waits for it to return
         single_release.set()
-        await asyncio.sleep(0.1)
 
         # Now acquire should succeed immediately (within 0.5s)
         async with asyncio.timeout(0.5):
@@ -136,8 +145,7 @@ class TestPoolExhaustion:
                 await conn.fetchval("SELECT 1")
                 raise IntentionalTestError
 
-        # Pool size should be restored
-        await asyncio.sleep(0.1)
+        # Pool size should be restored; release completes as the context exits
         final_size = small_pool.pool_size
         assert final_size == initial_size, f"Pool size should be restored: {initial_size} -> {final_size}"
 
@@ -195,7 +203,6 @@ class TestPoolExhaustion:
             async with small_pool.aacquire() as conn:
                 await conn.fetchval("SELECT 1")
 
-        await asyncio.sleep(0.1)
         assert small_pool.pool_size == initial_size, "Pool size should be unchanged after normal exits"
 
         # Exception exit - 10 iterations
@@ -212,7 +219,6 @@ class TestPoolExhaustion:
             with suppress(LeakTestError):
                 await trigger_exception_in_context()
 
-        await asyncio.sleep(0.1)
         assert small_pool.pool_size == initial_size, "Pool size should be unchanged even after exception exits"
 
     async def test_concurrent_acquire_release_stress(self, small_pool: AsyncConnectionPool) -> None:
@@ -286,24 +292,34 @@ class TestPoolSizeDynamics:
         initial_size = dynamic_pool.pool_size
         assert initial_size >= 2
 
+        release_event = asyncio.Event()
+        all_acquired = asyncio.Event()
+        connections_acquired = 0
+
         async def long_running_query() -> int:
-            """Query that holds connection briefly."""
+            """Query that holds connection until the pool size is sampled."""
+            nonlocal connections_acquired
             async with dynamic_pool.aacquire() as conn:
-                await asyncio.sleep(0.1)
+                connections_acquired += 1
+                if connections_acquired == 8:
+                    all_acquired.set()
+                await release_event.wait()
                 result: int = await conn.fetchval("SELECT 1")
                 return result
 
         # Launch 8 concurrent queries
         tasks = [asyncio.create_task(long_running_query()) for _ in range(8)]
 
-        # Give pool time to scale up
-        await asyncio.sleep(0.2)
+        # Wait until the pool has scaled up to serve all of them
+        await asyncio.wait_for(all_acquired.wait(), timeout=5.0)
 
         # Pool should have grown
         peak_size = dynamic_pool.pool_size
         assert peak_size > initial_size, f"Pool should grow: {initial_size} -> {peak_size}"
         assert peak_size <= 10, f"Pool should not exceed max_size: {peak_size}"
 
+        release_event.set()
+
         # All tasks should complete
         results = await asyncio.gather(*tasks)
         assert all(r == 1 for r in results)
@@ -353,7 +369,6 @@ class TestPoolSizeDynamics:
             result: int = await dynamic_pool.afetchval("SELECT 1")
             assert result == 1
             sizes.append(dynamic_pool.pool_size)
-            await asyncio.sleep(0.05)
 
         # Pool size should be relatively stable
         size_changes = [abs(sizes[i] - sizes[i - 1]) for i in range(1, len(sizes))]
@@ -371,15 +386,21 @@ class TestPoolSizeDynamics:
         3. Verify pool recovers after release
         """
         release_event = asyncio.Event()
+        all_acquired = asyncio.Event()
+        connections_acquired = 0
 
         async def hold_connection() -> None:
             """Hold connection until signaled."""
+            nonlocal connections_acquired
             async with dynamic_pool.aacquire():
+                connections_acquired += 1
+                if connections_acquired == 10:
+                    all_acquired.set()
                 await release_event.wait()
 
         # Hold all max_size connections
         holders = [asyncio.create_task(hold_connection()) for _ in range(10)]
-        await asyncio.sleep(0.3)
+        await asyncio.wait_for(all_acquired.wait(), timeout=5.0)
 
         # Next acquire should timeout
         async def acquire_connection() -> None:
@@ -453,8 +474,6 @@ class TestPoolSizeDynamics:
                 await conn.fetchval("SELECT 1")
                 raise ContextManagerTestError
 
-        await asyncio.sleep(0.1)
-
         # Pool size should be unchanged
         final_size = dynamic_pool.pool_size
         assert final_size == initial_size, f"Pool size changed: {initial_size} -> {final_size}"
@@ -560,6 +579,72 @@ class TestConnectionFailureRecovery:
         final_size = recovery_pool.pool_size
         assert final_size >= initial_size - 1
 
+    async def test_acheck_discards_server_terminated_connections(self, recovery_pool: AsyncConnectionPool) -> None:
+        """Test that acheck leaves no broken connection in the pool.
+
+        Scenario:
+        1. Terminate one pooled connection's backend from another connection
+        2. Run acheck instead of waiting for the pool to notice
+        3. Verify the terminated backend was replaced and every idle
+           connection now answers a query
+
+        Whether acheck itself discards the victim or asyncpg already replaced
+        it on release or acquire depends on when the client sees the server's
+        FATAL message, so the test checks the outcome rather than the count.
+        """
+        async with recovery_pool.aacquire() as victim, recovery_pool.aacquire() as killer:
+            victim_pid: int = await victim.fetchval("SELECT pg_backend_pid()")
+            terminated: bool = await killer.fetchval("SELECT pg_terminate_backend($1)", victim_pid)
+            assert terminated
+
+        await recovery_pool.acheck()
+
+        idle = recovery_pool.pool_idle_size
+        connections = [await recovery_pool.pool.acquire() for _ in range(idle)]
+        try:
+            pids = await asyncio.gather(*(conn.fetchval("SELECT pg_backend_pid()") for conn in connections))
+        finally:
+            for conn in connections:
+                await recovery_pool.pool.release(conn)
+        assert len(pids) == idle
+        assert victim_pid not in pids
+
+    async def test_acheck_discards_connection_that_fails_probe(
+        self, recovery_pool: AsyncConnectionPool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that acheck terminates and counts a connection whose probe fails.
+
+        Scenario:
+        1. Make the probe fail on exactly one idle connection
+        2. Run acheck and verify it reports one discarded connection
+        3. Verify that connection's backend is gone from the pool
+        """
+        await recovery_pool.awarmup()
+        idle = recovery_pool.pool_idle_size
+        assert idle >= 2
+
+        original_fetchval = Connection.fetchval
+        failed_pids: list[int] = []
+
+        async def afailing_fetchval(self: Connection, query: str, *args: object, **kwargs: Any) -> Any:
+            if query == "SELECT 1" and not failed_pids:
+                failed_pids.append(self.get_server_pid())
+                raise asyncpg.InterfaceError("simulated broken connection")
+            return await original_fetchval(self, query, *args, **kwargs)
+
+        monkeypatch.setattr(Connection, "fetchval", afailing_fetchval)
+        discarded = await recovery_pool.acheck()
+        monkeypatch.undo()
+
+        assert discarded == 1
+        connections = [await recovery_pool.pool.acquire() for _ in range(recovery_pool.pool_idle_size)]
+        try:
+            pids = [conn.get_server_pid() for conn in connections]
+        finally:
+            for conn in connections:
+                await recovery_pool.pool.release(conn)
+        assert failed_pids[0] not in pids
+
     async def test_query_fails_with_closed_connection(self, recovery_pool: AsyncConnectionPool) -> None:
         """Test that queries fail appropriately with closed connections.
 
@@ -602,46 +687,50 @@ class TestConnectionFailureRecovery:
         final_health = await recovery_pool.ahealth_check()
         assert final_health.status == HealthStatus.HEALTHY
 
-    async def test_concurrent_connection_failures(self, recovery_pool: AsyncConnectionPool) -> None:
+    @pytest.mark.parametrize(
+        "fail_pattern",
+        [
+            (True, False, True, False, False),
+            (True, True, True, False, False),
+            (True, True, True, True, True),
+        ],
+        ids=["some_fail", "most_fail", "all_fail"],
+    )
+    async def test_concurrent_connection_failures(
+        self, recovery_pool: AsyncConnectionPool, fail_pattern: tuple[bool, ...]
+    ) -> None:
         """Test pool handles multiple concurrent connection failures.
 
         Scenario:
         1. Acquire multiple connections concurrently
-        2. Close some connections mid-operation
+        2. Close the connections selected by ``fail_pattern`` mid-operation
         3. Verify pool handles failures gracefully
         4. Verify pool recovers and remains functional
         """
-        failure_count = 0
+        failed = [False] * len(fail_pattern)
 
-        async def operation_with_possible_failure(fail: bool) -> None:
-            nonlocal failure_count
+        async def operation_with_possible_failure(index: int, fail: bool) -> None:
             try:
                 async with recovery_pool.aacquire() as conn:
                     await conn.execute("INSERT INTO test_recovery (value) VALUES ($1)", 100)
 
                     if fail:
                         await conn.close()
-                        failure_count += 1
+                        failed[index] = True
 
                     await conn.execute("INSERT INTO test_recovery (value) VALUES ($1)", 200)
             except asyncpg.exceptions.InterfaceError:
                 pass
 
-        # Run mix of failing and successful operations
-        await asyncio.gather(
-            operation_with_possible_failure(fail=True),
-            operation_with_possible_failure(fail=False),
-            operation_with_possible_failure(fail=True),
-            operation_with_possible_failure(fail=False),
-            operation_with_possible_failure(fail=False),
-            return_exceptions=True,
-        )
-
-        assert failure_count > 0
+        # Run mix of failing and successful operations; anything other than
+        # the expected InterfaceError fails the test through the TaskGroup
+        async with asyncio.TaskGroup() as tg:
+            for index, fail in enumerate(fail_pattern):
+                tg.create_task(operation_with_possible_failure(index, fail))
 
-        # Pool should recover
-        await asyncio.sleep(0.1)
+        assert any(failed)
 
+        # Pool should recover: this acquires a working connection
         result: int = await recovery_pool.afetchval("SELECT COUNT(*) FROM test_recovery")
         assert result > 0
 
@@ -667,16 +756,15 @@ class TestConnectionFailureRecovery:
             await conn1.close()
             await conn2.close()
 
-        await asyncio.sleep(0.2)
-
         async with recovery_pool.aacquire() as fresh_conn:
             result: int = await fresh_conn.fetchval("SELECT COUNT(*) FROM test_recovery")
             assert result == 2
 
-            await fresh_conn.execute("INSERT INTO test_recovery (value) VALUES ($1)", 300)
-
-        final_count: int = await recovery_pool.afetchval("SELECT COUNT(*) FROM test_recovery")
-        assert final_count == 3
+            # The table is emptied and its sequence restarted, so the third row is id 3
+            new_id: int = await fresh_conn.fetchval(
+                "INSERT INTO test_recovery (value) VALUES ($1) RETURNING id", 300
+            )
+            assert new_id == 3
 
     async def test_health_check_after_connection_failures(self, recovery_pool: AsyncConnectionPool) -> None:
         """Test health check remains accurate after connection failures.
@@ -687,14 +775,16 @@ class TestConnectionFailureRecovery:
         3. Verify health status is accurate
         4. Verify pool metrics are correct
         """
-        for _ in range(3):
+
+        async def inject_failure() -> None:
             with suppress(asyncpg.exceptions.InterfaceError):
                 async with recovery_pool.aacquire() as conn:
                     await conn.execute("INSERT INTO test_recovery (value) VALUES ($1)", 100)
                     await conn.close()
                     await conn.execute("INSERT INTO test_recovery (value) VALUES ($1)", 200)
 
-        await asyncio.sleep(0.2)
+        # max_size=5, so all three failures run on separate connections at once
+        await asyncio.gather(*[inject_failure() for _ in range(3)])
 
         health = await recovery_pool.ahealth_check()
         assert health.status == HealthStatus.HEALTHY
@@ -32,7 +32,7 @@ if TYPE_CHECKING:
     from leitmotif.infrastructure.postgres import AsyncConnectionPool
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def timeout_pool_with_data(postgres_container: PostgresContainer) -> AsyncIterator[AsyncConnectionPool]:
     """Provide timeout pool with pre-populated test data.
 
@@ -77,8 +77,7 @@ async def timeout_pool_with_data(postgres_container: PostgresContainer) -> Async
         try:
             yield pool
         finally:
-            async with pool.aacquire() as conn:
-                await conn.execute("DROP TABLE IF EXISTS test_data CASCADE")
+            await pool.aexecute("DROP TABLE IF EXISTS test_data")
 
 
 @pytest.mark.asyncio
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from leitmotif.infrastructure.postgres import AsyncConnectionPool
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(loop_scope="session")
 async def conflict_pool_with_tables(
     postgres_container: PostgresContainer,
 ) -> AsyncIterator[AsyncConnectionPool]:
@@ -80,12 +80,10 @@ async def conflict_pool_with_tables(
         try:
             yield pool
         finally:
-            async with pool.aacquire() as conn:
-                await conn.execute("DROP TABLE IF EXISTS test_accounts CASCADE")
-                await conn.execute("DROP TABLE IF EXISTS test_orders CASCADE")
+            await pool.aexecute("DROP TABLE IF EXISTS test_accounts, test_orders")
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
 async def _cleanup_conflict_data(conflict_pool_with_tables: AsyncConnectionPool) -> None:
     """Clean up test data before each test."""
     async with conflict_pool_with_tables.aacquire() as conn:
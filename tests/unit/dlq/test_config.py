@@ -21,6 +21,7 @@ class TestDLQConfigDefaults:
             ("max_requeue_attempts", 3),
             ("block_timeout_ms", 5000),
             ("claim_timeout_ms", 60_000),
+            ("count_cache_ttl_ms", 100),
             ("batch_size", 100),
         ],
     )
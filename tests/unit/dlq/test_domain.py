@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 from typing import Any
 
@@ -201,9 +202,14 @@ class TestDeadLetterEntryImmutability:
         self, entry: DeadLetterEntry, field: str, value: str | bytes | int
     ) -> None:
         """Test frozen model fields cannot be modified after creation."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(FrozenInstanceError):
             setattr(entry, field, value)
 
+    def test_entry_uses_slots(self, entry: DeadLetterEntry) -> None:
+        """Test entries carry no per-instance __dict__."""
+        assert not hasattr(entry, "__dict__")
+        assert "payload" in DeadLetterEntry.__slots__
+
     def test_frozen_model_not_hashable_due_to_dict(self, entry: DeadLetterEntry) -> None:
         """Test frozen model is NOT hashable due to mutable dict field.
 
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import json
+import logging
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -11,7 +14,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from redis.exceptions import ResponseError
 
-from transcreation.services.dlq import DeadLetterEntry, DeadLetterQueue, DLQConfig, FailureCategory
+from transcreation.services.dlq import DeadLetterEntry, DeadLetterQueue, DLQConfig, DLQIngressItem, FailureCategory
+from transcreation.services.dlq import service as dlq_service
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -36,14 +40,25 @@ def mock_redis() -> MagicMock:
     redis.xpending = AsyncMock(return_value={"pending": 0})
     redis.xpending_range = AsyncMock(return_value=[])
     redis.xclaim = AsyncMock(return_value=[])
+    redis.xautoclaim = AsyncMock(return_value=[b"0-0", [], []])
+    redis.info = AsyncMock(return_value={"redis_version": "7.2.4"})
     redis.eval = AsyncMock(return_value=1)  # For Lua script execution
+
+    pipe = MagicMock()
+    pipe.__aenter__.return_value = pipe
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
     return redis
 
 
 @pytest.fixture
 def mock_redis_client(mock_redis: MagicMock) -> MagicMock:
-    """Create a mock BaseRedisClient with async context manager."""
+    """Create a mock BaseRedisClient with async context manager.
+
+    Mock replies are bytes, matching a client built with decode_responses=False.
+    """
     client = MagicMock()
+    client.config.driver.decode_responses = False
 
     @asynccontextmanager
     async def mock_aget_client() -> AsyncIterator[MagicMock]:
@@ -176,6 +191,56 @@ class TestAinitialize:
         await dlq.ainitialize()  # Second call should be no-op
         mock_redis.xgroup_create.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_create_group_once(
+        self, mock_redis_client: MagicMock, mock_redis: MagicMock, dlq_config: DLQConfig
+    ) -> None:
+        """Test concurrent ainitialize calls issue a single XGROUP CREATE."""
+        dlq = DeadLetterQueue(mock_redis_client, dlq_config)
+        await asyncio.gather(*(dlq.ainitialize() for _ in range(5)))
+        mock_redis.xgroup_create.assert_called_once()
+        assert dlq._initialized is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("redis_version", "expected"),
+        [("7.2.4", True), ("6.2.0", True), ("6.0.16", False), ("", False)],
+    )
+    async def test_detects_xautoclaim_support(
+        self,
+        mock_redis_client: MagicMock,
+        mock_redis: MagicMock,
+        dlq_config: DLQConfig,
+        redis_version: str,
+        expected: bool,
+    ) -> None:
+        """Test ainitialize enables XAUTOCLAIM only on Redis 6.2+."""
+        mock_redis.info.return_value = {"redis_version": redis_version}
+        dlq = DeadLetterQueue(mock_redis_client, dlq_config)
+        await dlq.ainitialize()
+        assert dlq._supports_xautoclaim is expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("node_versions", "expected"),
+        [(("7.2.4", "7.0.15"), True), (("7.2.4", "6.0.16"), False)],
+    )
+    async def test_detects_xautoclaim_support_on_cluster(
+        self,
+        mock_redis_client: MagicMock,
+        mock_redis: MagicMock,
+        dlq_config: DLQConfig,
+        node_versions: tuple[str, ...],
+        expected: bool,
+    ) -> None:
+        """Test ainitialize reads per-node INFO replies from RedisCluster and uses the oldest node."""
+        mock_redis.info.return_value = {
+            f"10.0.0.{i}:6379": {"redis_version": version} for i, version in enumerate(node_versions)
+        }
+        dlq = DeadLetterQueue(mock_redis_client, dlq_config)
+        await dlq.ainitialize()
+        assert dlq._supports_xautoclaim is expected
+
 
 class TestDeadLetter:
     """Tests for dead_letter method."""
@@ -310,8 +375,8 @@ class TestDeadLetter:
         assert fields["id"].count("-") == 4
 
     @pytest.mark.asyncio
-    async def test_stores_metadata_with_prefix(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
-        """Test dead_letter stores metadata with meta_ prefix."""
+    async def test_stores_metadata_as_single_json_field(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test dead_letter stores metadata as one JSON-encoded meta field."""
         try:
             raise ValueError("Test")
         except ValueError as e:
@@ -323,8 +388,8 @@ class TestDeadLetter:
             )
 
         fields = mock_redis.xadd.call_args[1]["fields"]
-        assert fields["meta_trace_id"] == "abc123"
-        assert fields["meta_user_id"] == "user_456"
+        assert json.loads(fields["meta"]) == {"trace_id": "abc123", "user_id": "user_456"}
+        assert not any(str(key).startswith("meta_") for key in fields)
 
     @pytest.mark.asyncio
     async def test_stores_category_value(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
@@ -343,6 +408,45 @@ class TestDeadLetter:
         assert fields["category"] == "permanent"
 
 
+class TestDeadLetterMany:
+    """Tests for dead_letter_many method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_for_no_items(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test dead_letter_many skips Redis entirely for an empty batch."""
+        assert await dlq.dead_letter_many([]) == []
+        mock_redis.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pipelines_all_xadds(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test dead_letter_many buffers every XADD in one pipeline execute."""
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [b"1-0", b"2-0"]
+        items = [
+            DLQIngressItem(payload=b"a", error=ValueError("a"), source_queue="q", entry_id="entry-a"),
+            DLQIngressItem(
+                payload=b"b",
+                error=KeyError("b"),
+                source_queue="q",
+                category=FailureCategory.POISON,
+                metadata={"trace_id": "abc"},
+            ),
+        ]
+
+        stream_ids = await dlq.dead_letter_many(items)
+
+        assert stream_ids == ["1-0", "2-0"]
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_awaited_once()
+        mock_redis.xadd.assert_not_called()
+
+        first, second = (call.kwargs["fields"] for call in pipe.xadd.call_args_list)
+        assert first["id"] == "entry-a"
+        assert first["error_type"] == "ValueError"
+        assert second["category"] == "poison"
+        assert json.loads(second["meta"]) == {"trace_id": "abc"}
+
+
 class TestRead:
     """Tests for read method."""
 
@@ -485,6 +589,25 @@ class TestAcknowledge:
         count = await dlq.acknowledge([sample_entry, sample_entry, sample_entry])
         assert count == 3
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("level", "expected_calls"), [(logging.WARNING, 0), (logging.INFO, 1)])
+    async def test_skips_info_log_when_level_disabled(
+        self,
+        dlq: DeadLetterQueue,
+        sample_entry: DeadLetterEntry,
+        monkeypatch: pytest.MonkeyPatch,
+        level: int,
+        expected_calls: int,
+    ) -> None:
+        """Test acknowledge only emits its INFO event when INFO is enabled."""
+        mock_logger = MagicMock()
+        monkeypatch.setattr(dlq_service, "logger", mock_logger)
+        monkeypatch.setattr(dlq_service._level_logger, "isEnabledFor", lambda lvl: lvl >= level)
+
+        await dlq.acknowledge([sample_entry])
+
+        assert mock_logger.info.call_count == expected_calls
+
     @pytest.mark.asyncio
     async def test_returns_zero_for_empty_list(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
         """Test acknowledge returns 0 for empty list."""
@@ -570,52 +693,110 @@ class TestRequeue:
         await dlq.requeue(sample_entry)
 
         fields = mock_redis.xadd.call_args[1]["fields"]
-        assert fields["meta_key"] == "value"
+        assert json.loads(fields["meta"]) == {"key": "value"}
 
 
 class TestClaimStale:
     """Tests for claim_stale method."""
 
+    @staticmethod
+    def _stream_entry(stream_id: bytes) -> tuple[bytes, dict[bytes, bytes]]:
+        return (
+            stream_id,
+            {
+                b"id": b"entry-1",
+                b"payload": base64.b64encode(b"payload"),
+                b"error_type": b"ValueError",
+                b"error_message": b"Error",
+                b"category": b"transient",
+                b"source_queue": b"queue",
+                b"timestamp": datetime.now(UTC).isoformat().encode(),
+            },
+        )
+
+    @pytest.fixture
+    async def legacy_dlq(
+        self, mock_redis_client: MagicMock, mock_redis: MagicMock, dlq_config: DLQConfig
+    ) -> DeadLetterQueue:
+        """DLQ connected to a Redis server that predates XAUTOCLAIM."""
+        mock_redis.info.return_value = {"redis_version": "6.0.16"}
+        dlq = DeadLetterQueue(mock_redis_client, dlq_config)
+        await dlq.ainitialize()
+        return dlq
+
     @pytest.mark.asyncio
     async def test_returns_empty_when_no_pending(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
-        """Test claim_stale returns empty list when no pending messages."""
-        mock_redis.xpending_range.return_value = []
+        """Test claim_stale returns empty list when nothing is idle long enough."""
         entries = await dlq.claim_stale()
         assert entries == []
 
     @pytest.mark.asyncio
-    async def test_claims_stale_messages(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
-        """Test claim_stale claims messages past timeout."""
+    async def test_claims_via_xautoclaim(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test claim_stale discovers and claims in a single XAUTOCLAIM call."""
+        mock_redis.xautoclaim.return_value = [b"0-0", [self._stream_entry(b"123-0")], []]
+
+        entries = await dlq.claim_stale()
+
+        assert len(entries) == 1
+        assert entries[0].stream_id == "123-0"
+        mock_redis.xautoclaim.assert_called_once_with(
+            name="test:dlq",
+            groupname="test-consumers",
+            consumername=dlq.consumer_id,
+            min_idle_time=1000,
+            start_id="0-0",
+            count=10,
+        )
+        mock_redis.xpending_range.assert_not_called()
+        mock_redis.xclaim.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_entries_deleted_while_pending(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test claim_stale ignores entries whose body redis-py parsed to an empty dict."""
+        mock_redis.xautoclaim.return_value = [b"0-0", [(b"122-0", {}), self._stream_entry(b"123-0")]]
+
+        entries = await dlq.claim_stale()
+
+        assert [entry.stream_id for entry in entries] == ["123-0"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_claims_stale_messages(self, legacy_dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test claim_stale falls back to XPENDING + XCLAIM before Redis 6.2."""
         mock_redis.xpending_range.return_value = [
             {"message_id": b"123-0", "time_since_delivered": 2000}  # > 1000ms timeout
         ]
-        mock_redis.xclaim.return_value = [
-            (
-                b"123-0",
-                {
-                    b"id": b"entry-1",
-                    b"payload": base64.b64encode(b"payload").decode().encode(),
-                    b"error_type": b"ValueError",
-                    b"error_message": b"Error",
-                    b"category": b"transient",
-                    b"source_queue": b"queue",
-                    b"timestamp": datetime.now(UTC).isoformat().encode(),
-                },
-            )
-        ]
+        mock_redis.xclaim.return_value = [self._stream_entry(b"123-0")]
 
-        entries = await dlq.claim_stale()
+        entries = await legacy_dlq.claim_stale()
         assert len(entries) == 1
         mock_redis.xclaim.assert_called_once()
+        mock_redis.xautoclaim.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_legacy_skips_entries_deleted_while_pending(
+        self, legacy_dlq: DeadLetterQueue, mock_redis: MagicMock
+    ) -> None:
+        """Test the XCLAIM fallback ignores entries deleted while pending."""
+        mock_redis.xpending_range.return_value = [
+            {"message_id": b"122-0", "time_since_delivered": 2000},
+            {"message_id": b"123-0", "time_since_delivered": 2000},
+        ]
+        mock_redis.xclaim.return_value = [(b"122-0", {}), self._stream_entry(b"123-0")]
+
+        entries = await legacy_dlq.claim_stale()
+
+        assert [entry.stream_id for entry in entries] == ["123-0"]
 
     @pytest.mark.asyncio
-    async def test_does_not_claim_fresh_messages(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
-        """Test claim_stale does not claim messages below timeout."""
+    async def test_legacy_does_not_claim_fresh_messages(
+        self, legacy_dlq: DeadLetterQueue, mock_redis: MagicMock
+    ) -> None:
+        """Test the XCLAIM fallback does not claim messages below timeout."""
         mock_redis.xpending_range.return_value = [
             {"message_id": b"123-0", "time_since_delivered": 500}  # < 1000ms timeout
         ]
 
-        entries = await dlq.claim_stale()
+        entries = await legacy_dlq.claim_stale()
         assert entries == []
         mock_redis.xclaim.assert_not_called()
 
@@ -658,6 +839,13 @@ class TestRedriveMessage:
         # Instead, eval is used for atomic Lua script
         mock_redis.eval.assert_called_once()
 
+    def test_lua_script_writes_same_shape_as_redrive_messages(self) -> None:
+        """Test the redrive script builds message_id/payload/metadata fields instead of copying DLQ fields."""
+        script = DeadLetterQueue._REDRIVE_LUA_SCRIPT
+        assert "unpack(fields)" not in script
+        assert "'message_id'" in script
+        assert "cjson.decode" in script  # flattens the JSON meta field
+
     @pytest.mark.asyncio
     async def test_returns_false_when_not_found(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
         """Test redrive_message returns False when Lua script returns nil."""
@@ -770,6 +958,63 @@ class TestMonitoring:
         count = await dlq.get_pending_count()
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_get_message_count_reuses_cached_value(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test get_message_count serves repeated polls from the TTL cache."""
+        mock_redis.xlen.return_value = 42
+        assert await dlq.get_message_count() == 42
+
+        mock_redis.xlen.return_value = 43
+        assert await dlq.get_message_count() == 42
+        mock_redis.xlen.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_message_count_force_bypasses_cache(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test get_message_count(force=True) always queries Redis."""
+        mock_redis.xlen.return_value = 42
+        await dlq.get_message_count()
+
+        mock_redis.xlen.return_value = 43
+        assert await dlq.get_message_count(force=True) == 43
+        assert mock_redis.xlen.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_pending_count_reuses_cached_value(self, dlq: DeadLetterQueue, mock_redis: MagicMock) -> None:
+        """Test get_pending_count serves repeated polls from the TTL cache."""
+        mock_redis.xpending.return_value = {"pending": 15}
+        await dlq.get_pending_count()
+
+        mock_redis.xpending.return_value = {"pending": 16}
+        assert await dlq.get_pending_count() == 15
+        assert await dlq.get_pending_count(force=True) == 16
+
+    @pytest.mark.asyncio
+    async def test_dead_letter_invalidates_cached_message_count(
+        self, dlq: DeadLetterQueue, mock_redis: MagicMock
+    ) -> None:
+        """Test dead_letter drops the cached XLEN so the next read sees the new entry."""
+        mock_redis.xlen.return_value = 42
+        await dlq.get_message_count()
+
+        await dlq.dead_letter(b"payload", ValueError("boom"), "orders")
+
+        mock_redis.xlen.return_value = 43
+        assert await dlq.get_message_count() == 43
+        assert mock_redis.xlen.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_invalidates_cached_pending_count(
+        self, dlq: DeadLetterQueue, mock_redis: MagicMock, sample_entry: DeadLetterEntry
+    ) -> None:
+        """Test acknowledge drops the cached pending count."""
+        mock_redis.xpending.return_value = {"pending": 15}
+        await dlq.get_pending_count()
+
+        await dlq.acknowledge([sample_entry])
+
+        mock_redis.xpending.return_value = {"pending": 14}
+        assert await dlq.get_pending_count() == 14
+
 
 class TestHelpers:
     """Tests for helper methods."""
@@ -780,8 +1025,10 @@ class TestHelpers:
         result = dlq._decode_fields(fields_raw)
         assert result == {"key1": "value1", "key2": "value2"}
 
-    def test_decode_fields_handles_string_input(self, dlq: DeadLetterQueue) -> None:
-        """Test _decode_fields handles string input (no decode needed)."""
+    def test_decode_fields_handles_string_input(self, mock_redis_client: MagicMock, dlq_config: DLQConfig) -> None:
+        """Test _decode_fields passes strings through when decode_responses is enabled."""
+        mock_redis_client.config.driver.decode_responses = True
+        dlq = DeadLetterQueue(mock_redis_client, dlq_config)
         fields_raw: dict[bytes | str, bytes | str] = {"key1": "value1", "key2": "value2"}
         result = dlq._decode_fields(fields_raw)
         assert result == {"key1": "value1", "key2": "value2"}
@@ -811,7 +1058,60 @@ class TestHelpers:
         assert entry.category == FailureCategory.TRANSIENT
 
     def test_parse_entry_extracts_metadata(self, dlq: DeadLetterQueue) -> None:
-        """Test _parse_entry extracts metadata fields."""
+        """Test _parse_entry decodes the JSON meta field."""
+        fields = {
+            "id": "test-id",
+            "payload": base64.b64encode(b"payload").decode(),
+            "error_type": "ValueError",
+            "error_message": "Error",
+            "category": "transient",
+            "source_queue": "queue",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "meta": json.dumps({"trace_id": "abc123", "user_id": "user_456"}),
+        }
+
+        entry = dlq._parse_entry("123-0", fields)
+
+        assert entry.metadata == {"trace_id": "abc123", "user_id": "user_456"}
+
+    def test_parse_entry_falls_back_on_malformed_metadata(self, dlq: DeadLetterQueue) -> None:
+        """Test _parse_entry uses empty metadata when the meta field is not valid JSON."""
+        fields = {
+            "id": "test-id",
+            "payload": base64.b64encode(b"payload").decode(),
+            "error_type": "ValueError",
+            "error_message": "Error",
+            "category": "transient",
+            "source_queue": "queue",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "meta": "{not json",
+        }
+
+        entry = dlq._parse_entry("123-0", fields)
+
+        assert entry.id == "test-id"
+        assert entry.metadata == {}
+
+    @pytest.mark.parametrize("raw_metadata", ['"x"', "[1]", "null"])
+    def test_parse_entry_falls_back_on_non_object_metadata(self, dlq: DeadLetterQueue, raw_metadata: str) -> None:
+        """Test _parse_entry uses empty metadata when the meta field is valid JSON but not an object."""
+        fields = {
+            "id": "test-id",
+            "payload": base64.b64encode(b"payload").decode(),
+            "error_type": "ValueError",
+            "error_message": "Error",
+            "category": "transient",
+            "source_queue": "queue",
+            "timestamp": datetime.now(UTC).isoformat(),
+            "meta": raw_metadata,
+        }
+
+        entry = dlq._parse_entry("123-0", fields)
+
+        assert entry.metadata == {}
+
+    def test_parse_entry_extracts_legacy_prefixed_metadata(self, dlq: DeadLetterQueue) -> None:
+        """Test _parse_entry still reads legacy meta_ prefixed fields."""
         fields = {
             "id": "test-id",
             "payload": base64.b64encode(b"payload").decode(),
@@ -843,6 +1143,26 @@ class TestHelpers:
         assert entry.error_message == ""
         assert entry.category == FailureCategory.TRANSIENT
 
+    def test_safe_int_parses_bytes_and_str(self, dlq: DeadLetterQueue) -> None:
+        """Test _safe_int accepts both raw bytes and decoded strings."""
+        assert dlq._safe_int(b"42") == 42
+        assert dlq._safe_int("42") == 42
+        assert dlq._safe_int(b"not-a-number", 7) == 7
+
+    def test_parse_entry_repairs_invalid_counters(self, dlq: DeadLetterQueue) -> None:
+        """Test _parse_entry falls back to zero for corrupted or negative counters."""
+        fields = {
+            "id": "test-id",
+            "error_type": "ValueError",
+            "retry_count": "garbage",
+            "requeue_count": "-3",
+        }
+
+        entry = dlq._parse_entry("123-0", fields)
+
+        assert entry.retry_count == 0
+        assert entry.requeue_count == 0
+
     def test_parse_entry_handles_invalid_timestamp(self, dlq: DeadLetterQueue) -> None:
         """Test _parse_entry handles invalid timestamp."""
         fields = {
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+from functools import partial
 from typing import Literal
 
 import pytest
-from tenacity import RetryCallState
+from tenacity import RetryCallState, RetryError
 
 from transcreation.config.retry import RetryConfig
 from transcreation.resilience.retry import retry
@@ -495,6 +498,117 @@ class TestRetryDecoratorAsync:
         for duration in sleep_durations:
             assert config.wait_min <= duration <= config.wait_max
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("jitter_mode", ["full", "equal", "decorrelated"])
+    async def test_wait_times_within_bounds_for_each_jitter_mode(
+        self,
+        default_retry_config: RetryConfig,
+        jitter_mode: Literal["full", "equal", "decorrelated"],
+    ) -> None:
+        """Verify every jitter mode keeps sleep durations within [wait_min, wait_max]."""
+        sleep_durations: list[float] = []
+
+        def capture_sleep(retry_state: RetryCallState) -> None:
+            if retry_state.next_action:
+                sleep_durations.append(retry_state.next_action.sleep)
+
+        config = default_retry_config.model_copy(
+            update={"max_attempts": 5, "multiplier": 0.01, "jitter_mode": jitter_mode}
+        )
+
+        @retry(config, before_sleep=capture_sleep)
+        async def always_fails() -> None:
+            raise ConnectionError("Fail")
+
+        with pytest.raises(ConnectionError):
+            await always_fails()
+
+        assert len(sleep_durations) == 4
+        for duration in sleep_durations:
+            assert config.wait_min <= duration <= config.wait_max
+
+    @pytest.mark.asyncio
+    async def test_single_attempt_propagates_first_error(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify max_attempts=1 without callbacks calls once and raises the original error."""
+        call_count = 0
+        config = default_retry_config.model_copy(update={"max_attempts": 1})
+
+        @retry(config)
+        async def fails_once() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("No retry budget")
+
+        with pytest.raises(ConnectionError, match="No retry budget"):
+            await fails_once()
+
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_single_attempt_with_callbacks_propagates_first_error(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify max_attempts=1 through tenacity raises the original error, not a wait error."""
+        call_count = 0
+        sleep_calls: list[int] = []
+        config = default_retry_config.model_copy(update={"max_attempts": 1})
+
+        @retry(config, before_sleep=lambda s: sleep_calls.append(s.attempt_number))
+        async def fails_once() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("No retry budget")
+
+        with pytest.raises(ConnectionError, match="No retry budget"):
+            await fails_once()
+
+        assert call_count == 1
+        assert sleep_calls == []
+
+    @pytest.mark.asyncio
+    async def test_partial_coroutine_function_uses_async_path(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify a functools.partial over a coroutine function is retried asynchronously."""
+        call_count = 0
+
+        async def flaky(prefix: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise ConnectionError("Transient")
+            return f"{prefix}-success"
+
+        decorated = retry(default_retry_config)(partial(flaky, "async"))
+
+        assert inspect.iscoroutinefunction(decorated)
+        assert await decorated() == "async-success"
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_never_retried(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify CancelledError stops retrying even when BaseException is retryable."""
+        call_count = 0
+        # model_copy skips validation, mirroring a caller that widens the types.
+        config = default_retry_config.model_copy(
+            update={"retry_on_exceptions": (BaseException,)}
+        )
+
+        @retry(config)
+        async def cancelled() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled()
+
+        assert call_count == 1
+
 
 class TestRetryDecoratorSync:
     """Test sync retry decorator behavior."""
@@ -593,3 +707,53 @@ class TestRetryDecoratorSync:
         assert before_calls == [1, 2, 3]
         assert after_calls == [1, 2]
         assert sleep_calls == [1, 2]
+
+    def test_sync_single_attempt_without_reraise_raises_retry_error(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify max_attempts=1 with reraise=False wraps the error in RetryError."""
+        call_count = 0
+        config = default_retry_config.model_copy(
+            update={"max_attempts": 1, "reraise": False}
+        )
+
+        @retry(config)
+        def fails_once() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("No retry budget")
+
+        with pytest.raises(RetryError) as exc_info:
+            fails_once()
+
+        assert isinstance(exc_info.value.last_attempt.exception(), ConnectionError)
+        assert call_count == 1
+
+
+class TestRetryFactory:
+    """Test the retry() factory."""
+
+    def test_equal_configs_share_retry_instance(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify retry() reuses one Retry for equal configs and the same callbacks."""
+        same = default_retry_config.model_copy()
+        other = default_retry_config.model_copy(update={"max_attempts": 4})
+
+        assert retry(default_retry_config) is retry(same)
+        assert retry(default_retry_config) is not retry(other)
+        assert retry(default_retry_config) is not retry(
+            default_retry_config, before=lambda _: None
+        )
+
+    def test_retry_with_callbacks_is_not_shared(
+        self, default_retry_config: RetryConfig
+    ) -> None:
+        """Verify retry() never caches callbacks, so it cannot keep them alive."""
+
+        def before(_: RetryCallState) -> None:
+            return None
+
+        assert retry(default_retry_config, before=before) is not retry(
+            default_retry_config, before=before
+        )